@@ -0,0 +1,117 @@
+import gzip
+import re
+from hashlib import md5
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+QUALITY_RE = re.compile(r'q\s*=\s*([0-9.]+)')
+
+
+def accepted_encodings(header):
+    """Return the content codings of an Accept-Encoding header with q > 0."""
+    accepted = set()
+    for item in header.split(','):
+        name, _, params = item.partition(';')
+        name = name.strip().lower()
+        match = QUALITY_RE.search(params)
+        try:
+            quality = float(match.group(1)) if match else 1.0
+        except ValueError:
+            continue
+        if name and quality > 0:
+            accepted.add(name)
+    return accepted
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress API responses with brotli, when the library is installed and the
+    client accepts it, or with gzip.
+
+    Only responses of at least COMPRESSION_MIN_SIZE bytes whose content type
+    is listed in COMPRESSION_CONTENT_TYPES are compressed. Responses that
+    used or set a CSRF token never are: compressing a secret together with
+    reflected input exposes it to BREACH.
+
+    A view marks the responses it serves from its cache with
+    ``cache_compressed = True``; their compressed bytes are cached under a
+    digest of the body, so hot articles are not compressed again on every
+    hit and a changed body never gets stale bytes.
+    """
+
+    def is_compressible(self, request, response):
+        if response.streaming or response.status_code != 200:
+            return False
+        if response.has_header('Content-Encoding'):
+            return False
+        min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        if len(response.content) < min_size:
+            return False
+        if request.META.get('CSRF_COOKIE_USED'):
+            return False
+        if settings.CSRF_COOKIE_NAME in response.cookies:
+            return False
+        content_type = response.get('Content-Type', '').split(';')[0]
+        content_types = getattr(
+            settings, 'COMPRESSION_CONTENT_TYPES', ['application/json']
+        )
+        return content_type.strip().lower() in content_types
+
+    def process_response(self, request, response):
+        if not self.is_compressible(request, response):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = self.choose_encoding(
+            request.META.get('HTTP_ACCEPT_ENCODING', '')
+        )
+        if encoding is None:
+            return response
+
+        if getattr(response, 'cache_compressed', False):
+            alias = getattr(settings, 'COMPRESSION_CACHE_ALIAS', 'default')
+            cache = caches[alias]
+            digest = md5(response.content).hexdigest()
+            cache_key = f'compressed:{encoding}:{digest}'
+            compressed = cache.get(cache_key)
+            if compressed is None:
+                compressed = self.compress(response.content, encoding)
+                timeout = getattr(settings, 'COMPRESSION_CACHE_TIMEOUT', 300)
+                cache.set(cache_key, compressed, timeout)
+        else:
+            compressed = self.compress(response.content, encoding)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        # The compressed body is no longer byte-for-byte the one the ETag
+        # was made for.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
+
+    def choose_encoding(self, header):
+        accepted = accepted_encodings(header)
+        if brotli is not None and ({'br', '*'} & accepted):
+            return 'br'
+        if {'gzip', '*'} & accepted:
+            return 'gzip'
+        return None
+
+    def compress(self, content, encoding):
+        if encoding == 'br':
+            quality = getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 5)
+            return brotli.compress(content, quality=quality)
+        level = getattr(settings, 'COMPRESSION_GZIP_LEVEL', 6)
+        return gzip.compress(content, compresslevel=level, mtime=0)
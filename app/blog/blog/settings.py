@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/3.0/ref/settings/
 """
 
 import os
+from datetime import timedelta
 
 from decouple import config
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
@@ -47,6 +48,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'blog.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -57,9 +59,20 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'blog.urls'
 
+# orjson is used for JSON when installed. The browsable API is only offered
+# while DEBUG is on, production answers JSON only.
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',  # <-- And here
+        'blog_auth.authentication.CachedTokenAuthentication',
+        'blog_auth.authentication.SignedTokenAuthentication',
+    ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'blog.renderers.FastJSONRenderer',
+    ] + (['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
+    'DEFAULT_PARSER_CLASSES': [
+        'blog.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
 }
 
@@ -96,9 +109,68 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/3.0/topics/cache/
+# Any backend works (locmem, file, database); with several worker processes
+# use a shared one so article invalidation reaches every worker.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'blog',
+    }
+}
+
+ARTICLE_CACHE_ALIAS = 'default'
+ARTICLE_CACHE_TIMEOUT = 300
+ARTICLE_LEADERBOARD_TIMEOUT = 60
+
+# Article reads are buffered per process and written every
+# ARTICLE_VIEWS_FLUSH_INTERVAL seconds or ARTICLE_VIEWS_FLUSH_SIZE reads.
+ARTICLE_VIEWS_FLUSH_INTERVAL = 10
+ARTICLE_VIEWS_FLUSH_SIZE = 1000
+
+# Token owners are cached for TOKEN_CACHE_LOCAL_TIMEOUT seconds in an LRU of
+# TOKEN_CACHE_SIZE entries per process, and for TOKEN_CACHE_TIMEOUT seconds in
+# the TOKEN_CACHE_ALIAS cache, which is cleared on password, email and token changes.
+TOKEN_CACHE_ALIAS = 'default'
+TOKEN_CACHE_SIZE = 1024
+TOKEN_CACHE_LOCAL_TIMEOUT = 30
+TOKEN_CACHE_TIMEOUT = 300
+
+# Tokens unused for TOKEN_IDLE_TIMEOUT expire. A use is written at most once per
+# TOKEN_REFRESH_INTERVAL; purge_tokens deletes the expired ones.
+TOKEN_IDLE_TIMEOUT = timedelta(days=14)
+TOKEN_REFRESH_INTERVAL = timedelta(hours=1)
+
+# With SIGNED_TOKENS, login also returns a signed access token, checked without
+# a token lookup, and a refresh token to get new ones from api-auth/refresh/.
+SIGNED_TOKENS = False
+ACCESS_TOKEN_LIFETIME = timedelta(minutes=15)
+REFRESH_TOKEN_LIFETIME = timedelta(days=14)
+
+# Password hashes run on PASSWORD_HASHING_WORKERS threads shared by the request
+# threads of a process, see blog_auth.hashing. Beyond PASSWORD_HASHING_QUEUE_SIZE
+# waiting hashes, logins get a 503. Use 0 workers, hashing inline, under servers
+# running one request per process. Admins read the pool at api-auth/hashing/.
+PASSWORD_HASHING_WORKERS = 4
+PASSWORD_HASHING_QUEUE_SIZE = 32
+
+# Threads serving the async article views under ASGI, see blog_entries.async_views.
+ASYNC_ARTICLE_WORKERS = 8
+
+# API responses of at least COMPRESSION_MIN_SIZE bytes are compressed with
+# brotli when the brotli package is installed and accepted, otherwise gzip.
+# HTML pages carry CSRF tokens and are left alone, see blog.middleware.
+COMPRESSION_MIN_SIZE = 1024
+COMPRESSION_CONTENT_TYPES = ['application/json']
+COMPRESSION_GZIP_LEVEL = 6
+COMPRESSION_BROTLI_QUALITY = 5
+COMPRESSION_CACHE_ALIAS = 'default'
+COMPRESSION_CACHE_TIMEOUT = ARTICLE_CACHE_TIMEOUT
+
 AUTHENTICATION_BACKENDS = [
-    'django.contrib.auth.backends.ModelBackend',
-    'blog_auth.authentication.EmailAuthBackend'
+    'blog_auth.authentication.UsernameOrEmailBackend'
 ]
 
 # Settings for smtp server for send email.
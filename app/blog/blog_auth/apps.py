@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class BlogAuthConfig(AppConfig):
     name = 'blog_auth'
+
+    def ready(self):
+        from . import signals  # noqa: F401
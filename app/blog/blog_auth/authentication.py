@@ -1,15 +1,316 @@
+import pickle
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+from time import monotonic
+
+from django.conf import settings
 from django.contrib.auth.backends import ModelBackend
+from django.core import signing
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.authentication import (
+    BaseAuthentication, TokenAuthentication, get_authorization_header
+)
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+
+from . import hashing, tokens
+from .models import DataForAuthenticateUsers, User
+
+
+class UsernameOrEmailBackend(ModelBackend):
+    """
+    Authenticate with a username or an email address, resolved by one query.
+
+    The password is hashed exactly once per attempt, on the hashing pool:
+    against the matched user, or on its own when nothing matches, so a miss
+    takes as long as a wrong password.
+    """
+
+    def authenticate(
+        self, request, username=None, password=None, email=None, **kwargs
+    ):
+        login = username or email
+        if not login or password is None:
+            return None
+        user = self.get_login_user(login)
+        if user is None:
+            # Run the default password hasher once to reduce the timing
+            # difference between an existing and a nonexistent user.
+            hashing.make_password(password)
+            return None
+        valid = hashing.check_user_password(user, password)
+        if valid and self.user_can_authenticate(user):
+            return user
+
+    def get_login_user(self, login):
+        """
+        Return the user whose email matches login case-insensitively, an
+        exact match winning when several emails differ only in case, or the
+        user whose username is login.
+
+        A login containing '@' is looked up as an email first, so nobody can
+        take over the email login of a user by registering that address as
+        a username. Other logins are looked up as a username first.
+        """
+        candidates = list(DataForAuthenticateUsers._default_manager.filter(
+            Q(username=login) | Q(email__iexact=login)
+        ))
+        by_username = next(
+            (user for user in candidates if user.username == login), None
+        )
+        by_email = [
+            user for user in candidates if user.email.lower() == login.lower()
+        ]
+        exact = [user for user in by_email if user.email == login]
+        if exact:
+            by_email = exact[0]
+        else:
+            by_email = by_email[0] if len(by_email) == 1 else None
+        if '@' in login:
+            return by_email or by_username
+        return by_username or by_email
+
+
+class TokenCache:
+    """
+    Bounded in-process LRU of cache key to pickled token owner, with entries
+    expiring after TOKEN_CACHE_LOCAL_TIMEOUT seconds.
+
+    Entries are kept pickled, so every request gets its own instances.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            timeout = getattr(settings, 'TOKEN_CACHE_LOCAL_TIMEOUT', 30)
+            self.entries[key] = (monotonic() + timeout, value)
+            self.entries.move_to_end(key)
+            size = getattr(settings, 'TOKEN_CACHE_SIZE', 1024)
+            while len(self.entries) > size:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+token_cache = TokenCache()
+
+
+def _get_shared_cache():
+    return caches[getattr(settings, 'TOKEN_CACHE_ALIAS', 'default')]
+
+
+def _shared_cache_key(key):
+    # Keys of the shared cache may end up in logs, so the token is hashed.
+    return 'auth:token:' + sha256(key.encode('utf-8')).hexdigest()
+
+
+def _user_cache_key(user_id):
+    return f'auth:user:{user_id}'
+
 
-from .models import DataForAuthenticateUsers
+def _get_cached(key, load):
+    """
+    Return the value cached under key, in process or in the shared cache,
+    or cache and return load().
+    """
+    pickled = token_cache.get(key)
+    if pickled is None:
+        pickled = _get_shared_cache().get(key)
+        if pickled is None:
+            return _set_cached(key, load())
+        token_cache.set(key, pickled)
+    return pickle.loads(pickled)
 
 
-class EmailAuthBackend(ModelBackend):
+def _set_cached(key, value):
+    pickled = pickle.dumps(value)
+    timeout = getattr(settings, 'TOKEN_CACHE_TIMEOUT', 300)
+    _get_shared_cache().set(key, pickled, timeout)
+    token_cache.set(key, pickled)
+    return pickle.loads(pickled)
 
-    def authenticate(self, request, email, password, **kwargs):
+
+def _delete_cached(key):
+    token_cache.delete(key)
+    _get_shared_cache().delete(key)
+
+
+def invalidate_token(key):
+    """
+    Forget the cached users of a token, right away and again after commit.
+    Other processes drop their in-process copy within
+    TOKEN_CACHE_LOCAL_TIMEOUT.
+    """
+    key = _shared_cache_key(key)
+    _delete_cached(key)
+    transaction.on_commit(lambda: _delete_cached(key))
+
+
+def invalidate_user(auth_user_id):
+    """Forget the cached users behind the signed tokens of an auth user."""
+    key = _user_cache_key(auth_user_id)
+    _delete_cached(key)
+    transaction.on_commit(lambda: _delete_cached(key))
+
+
+def _without_password(auth_user):
+    """
+    Drop the password hash of an auth user about to be cached. The hash is
+    not needed to authenticate, and a full save() of a cached snapshot now
+    fails on the NOT NULL column instead of writing back stale fields.
+    Writes go through a freshly loaded user.
+    """
+    auth_user.password = None
+    return auth_user
+
+
+def _load_blog_user(queryset):
+    """
+    Return (auth user, blog user) read by one query over blog users joined
+    with their auth data, or None when queryset matches no blog user.
+    """
+    blog_user = queryset.select_related('user_authenticate_data').first()
+    if blog_user is None:
+        return None
+    return _without_password(blog_user.user_authenticate_data), blog_user
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that caches the token owner and its blog user, first
+    in process and then in the Django cache, so an authenticated request
+    usually runs no query at all. The blog user is put where
+    User.objects.get_for_auth_data finds it.
+
+    On a miss, one query reads the blog user together with its auth data and
+    the token use; only auth users without a blog user need the Token lookup.
+    The cached users may lag behind the database and carry no password hash,
+    so views that change an account load it again before writing.
+
+    Tokens unused for TOKEN_IDLE_TIMEOUT expire. Uses slide the expiry, but
+    are written at most once per TOKEN_REFRESH_INTERVAL.
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = _shared_cache_key(key)
+        auth_user, blog_user, last_used = _get_cached(
+            cache_key, lambda: self.load_users(key)
+        )
+        if not auth_user.is_active:
+            raise AuthenticationFailed(_('User inactive or deleted.'))
+        if tokens.is_expired(last_used):
+            raise AuthenticationFailed(_('Token has expired.'))
+        if tokens.needs_refresh(last_used):
+            _set_cached(cache_key, (auth_user, blog_user, tokens.touch(key)))
+        if blog_user is not None:
+            auth_user.blog_user_cache = blog_user
+        return auth_user, key
+
+    def load_users(self, key):
+        """Return (auth user, blog user or None, last use) of the token key."""
+        users = _load_blog_user(
+            User.objects.annotate(
+                token_created=F('user_authenticate_data__auth_token__created'),
+                token_last_used=F(
+                    'user_authenticate_data__auth_token__activity__last_used'
+                )
+            ).filter(user_authenticate_data__auth_token__key=key)
+        )
+        if users is not None:
+            auth_user, blog_user = users
+            last_used = blog_user.token_last_used or blog_user.token_created
+            del blog_user.token_created, blog_user.token_last_used
+            return auth_user, blog_user, last_used
+        try:
+            token = Token.objects.select_related(
+                'user', 'activity'
+            ).get(key=key)
+        except Token.DoesNotExist:
+            raise AuthenticationFailed(_('Invalid token.'))
+        return _without_password(token.user), None, tokens.get_last_used(token)
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    """
+    Authenticate ``Authorization: Bearer <access token>`` headers carrying a
+    signed access token from tokens.issue_signed_tokens.
+
+    The signature and lifetime are checked with SECRET_KEY alone; the token
+    owner comes from the same caches as CachedTokenAuthentication, so the
+    database is only read on a cache miss. Tokens signed with an older
+    token_version of the user, e.g. before a password change, are refused.
+    """
+    keyword = 'Bearer'
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise AuthenticationFailed(_('Invalid token header.'))
         try:
-            user = DataForAuthenticateUsers.objects.get(email=email)
+            value = auth[1].decode()
+        except UnicodeError:
+            raise AuthenticationFailed(_('Invalid token header.'))
+        return self.authenticate_credentials(value)
+
+    def authenticate_credentials(self, value):
+        try:
+            user_id, version = tokens.read_signed_token(
+                value, tokens.ACCESS_TOKEN_SALT, tokens.get_access_lifetime()
+            )
+        except signing.SignatureExpired:
+            raise AuthenticationFailed(_('Access token has expired.'))
+        except signing.BadSignature:
+            raise AuthenticationFailed(_('Invalid access token.'))
+        auth_user, blog_user = _get_cached(
+            _user_cache_key(user_id), lambda: self.load_users(user_id)
+        )
+        if not auth_user.is_active:
+            raise AuthenticationFailed(_('User inactive or deleted.'))
+        if auth_user.token_version != version:
+            raise AuthenticationFailed(_('Access token has been revoked.'))
+        if blog_user is not None:
+            auth_user.blog_user_cache = blog_user
+        return auth_user, value
+
+    def load_users(self, user_id):
+        users = _load_blog_user(
+            User.objects.filter(user_authenticate_data_id=user_id)
+        )
+        if users is not None:
+            return users
+        try:
+            auth_user = DataForAuthenticateUsers.objects.get(pk=user_id)
+            return _without_password(auth_user), None
         except DataForAuthenticateUsers.DoesNotExist:
-            pass
-        else:
-            if user.check_password(password) and self.user_can_authenticate(user):
-                return user
+            raise AuthenticationFailed(_('User inactive or deleted.'))
+
+    def authenticate_header(self, request):
+        return self.keyword
@@ -0,0 +1,192 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import perf_counter
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class HashingPoolFull(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = _(
+        'Too many password checks in progress, try again shortly.'
+    )
+    default_code = 'hashing_pool_full'
+
+
+def _verify(password, encoded):
+    """
+    Return whether password matches encoded and whether encoded needs a new
+    hash.
+    """
+    upgrade = []
+    valid = hashers.check_password(password, encoded, setter=upgrade.append)
+    return valid, bool(upgrade)
+
+
+class HashingPool:
+    """
+    Bounded thread pool the password hashes of logins, registrations and
+    password changes run on.
+
+    The pool limits how many hashes run at once in a process. It does not
+    free the caller: a sync request thread still blocks until its hash is
+    done, only async callers awaiting arun hold no thread. It pays off where
+    many request threads share one process, as with the threaded runserver
+    of docker-compose.yml and ASGI. There a login burst keeps at most
+    PASSWORD_HASHING_WORKERS cores busy, since hashlib releases the GIL, and
+    reads on the other threads still get CPU. Once PASSWORD_HASHING_QUEUE_SIZE
+    hashes are waiting, the next one is refused with HashingPoolFull, a 503,
+    which bounds the request threads held by hashing as well.
+
+    Under servers running one request per process there is nothing to share
+    and the queue limit never triggers; set 0 workers there, which hashes
+    inline as Django does.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.executor = None
+        self.in_flight = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self.lock:
+            self.peak_in_flight = self.in_flight
+            self.submitted = 0
+            self.completed = 0
+            self.rejected = 0
+            self.wait_seconds = 0.0
+            self.hash_seconds = 0.0
+
+    def get_workers(self):
+        return getattr(settings, 'PASSWORD_HASHING_WORKERS', 4)
+
+    def get_queue_size(self):
+        return getattr(settings, 'PASSWORD_HASHING_QUEUE_SIZE', 32)
+
+    def get_executor(self):
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.get_workers(),
+                    thread_name_prefix='password-hash'
+                )
+            return self.executor
+
+    def shutdown(self):
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def stats(self):
+        with self.lock:
+            return {
+                'workers': self.get_workers(),
+                'queue_size': self.get_queue_size(),
+                'in_flight': self.in_flight,
+                'queued': max(self.in_flight - self.get_workers(), 0),
+                'peak_in_flight': self.peak_in_flight,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'wait_seconds': self.wait_seconds,
+                'hash_seconds': self.hash_seconds,
+            }
+
+    def submit(self, function, *args):
+        """
+        Return a future of function(*args) run on the pool, or raise
+        HashingPoolFull when the queue is full.
+        """
+        with self.lock:
+            if self.in_flight >= self.get_workers() + self.get_queue_size():
+                self.rejected += 1
+                raise HashingPoolFull()
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            self.submitted += 1
+        try:
+            return self.get_executor().submit(
+                self._run, perf_counter(), function, *args
+            )
+        except BaseException:
+            with self.lock:
+                self.in_flight -= 1
+                self.submitted -= 1
+            raise
+
+    def _run(self, submitted_at, function, *args):
+        started = perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self._done(started - submitted_at, perf_counter() - started)
+
+    def _done(self, waited, hashed):
+        with self.lock:
+            self.in_flight -= 1
+            self.completed += 1
+            self.wait_seconds += waited
+            self.hash_seconds += hashed
+
+    def run(self, function, *args):
+        if not self.get_workers():
+            return function(*args)
+        return self.submit(function, *args).result()
+
+    async def arun(self, function, *args):
+        if not self.get_workers():
+            return function(*args)
+        return await asyncio.wrap_future(self.submit(function, *args))
+
+
+hashing_pool = HashingPool()
+
+
+def make_password(password):
+    return hashing_pool.run(hashers.make_password, password)
+
+
+async def amake_password(password):
+    return await hashing_pool.arun(hashers.make_password, password)
+
+
+def set_password(user, password):
+    """
+    Set the password of user as user.set_password does, hashing on the pool.
+    """
+    user.password = make_password(password)
+    user._password = password
+
+
+async def aset_password(user, password):
+    user.password = await amake_password(password)
+    user._password = password
+
+
+def check_password(password, encoded):
+    return hashing_pool.run(_verify, password, encoded)[0]
+
+
+async def acheck_password(password, encoded):
+    return (await hashing_pool.arun(_verify, password, encoded))[0]
+
+
+def check_user_password(user, password):
+    """
+    Check password of user as user.check_password does, hashing on the pool.
+    A password stored with an outdated hasher is hashed again and saved.
+    """
+    valid, upgrade = hashing_pool.run(_verify, password, user.password)
+    if upgrade:
+        set_password(user, password)
+        user._password = None
+        user.save(update_fields=['password'])
+    return valid
@@ -0,0 +1,80 @@
+from time import perf_counter
+
+from django.contrib.auth import authenticate
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import override_settings
+
+from blog_auth.models import DataForAuthenticateUsers
+
+PASSWORD = 'Benchmark123,.'
+
+BACKENDS = [
+    (
+        'ModelBackend, username only',
+        'django.contrib.auth.backends.ModelBackend'
+    ),
+    (
+        'UsernameOrEmailBackend',
+        'blog_auth.authentication.UsernameOrEmailBackend'
+    ),
+]
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        'Time a login with UsernameOrEmailBackend, for a username, an email, '
+        'a wrong password and an unknown login, with the configured password '
+        'hasher. Django\'s ModelBackend, which knows usernames only, is the '
+        'reference.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.benchmark(options['repeat'])
+                raise Rollback
+        except Rollback:
+            self.stdout.write('Benchmark user rolled back.')
+
+    def benchmark(self, repeat):
+        user = DataForAuthenticateUsers(
+            username='benchmark_login', email='benchmark_login@example.com'
+        )
+        user.set_password(PASSWORD)
+        user.save()
+        cases = [
+            ('username', user.username, PASSWORD),
+            ('email', user.email, PASSWORD),
+            ('wrong password', user.email, 'wrong'),
+            ('unknown login', 'nobody@example.com', PASSWORD),
+        ]
+        statements = []
+
+        def count_statements(execute, sql, params, many, context):
+            statements.append(sql)
+            return execute(sql, params, many, context)
+
+        for name, backend in BACKENDS:
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            with override_settings(AUTHENTICATION_BACKENDS=[backend]):
+                for case, login, password in cases:
+                    statements.clear()
+                    with connection.execute_wrapper(count_statements):
+                        start = perf_counter()
+                        for _ in range(repeat):
+                            authenticate(username=login, password=password)
+                        elapsed = perf_counter() - start
+                    milliseconds = elapsed * 1000 / repeat
+                    queries = len(statements) / repeat
+                    self.stdout.write(
+                        f'  {case}: {milliseconds:.1f} ms per login, '
+                        f'{queries:.1f} queries per login'
+                    )
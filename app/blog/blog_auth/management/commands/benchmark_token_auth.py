@@ -0,0 +1,85 @@
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIRequestFactory
+
+from blog_auth.authentication import (
+    CachedTokenAuthentication, SignedTokenAuthentication, invalidate_token,
+    invalidate_user
+)
+from blog_auth.models import DataForAuthenticateUsers, User
+from blog_auth.tokens import issue_signed_tokens
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        'Time authenticating one request with DRF TokenAuthentication, '
+        'CachedTokenAuthentication and SignedTokenAuthentication.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.benchmark(options['repeat'])
+                raise Rollback
+        except Rollback:
+            self.stdout.write('Benchmark user rolled back.')
+
+    def benchmark(self, repeat):
+        auth_user = DataForAuthenticateUsers.objects.create(
+            username='benchmark_auth',
+            email='benchmark_auth@example.com',
+            password='!'
+        )
+        User.objects.create(user_authenticate_data=auth_user)
+        token = Token.objects.create(user=auth_user)
+        access = issue_signed_tokens(auth_user)['access']
+        factory = APIRequestFactory()
+        cases = [
+            (
+                'TokenAuthentication', TokenAuthentication(),
+                f'Token {token.key}'
+            ),
+            (
+                'CachedTokenAuthentication', CachedTokenAuthentication(),
+                f'Token {token.key}'
+            ),
+            (
+                'SignedTokenAuthentication', SignedTokenAuthentication(),
+                f'Bearer {access}'
+            ),
+        ]
+        statements = []
+
+        def count_statements(execute, sql, params, many, context):
+            statements.append(sql)
+            return execute(sql, params, many, context)
+
+        try:
+            for name, authentication, header in cases:
+                request = factory.get('/', HTTP_AUTHORIZATION=header)
+                statements.clear()
+                with connection.execute_wrapper(count_statements):
+                    start = perf_counter()
+                    for _ in range(repeat):
+                        authentication.authenticate(request)
+                    elapsed = perf_counter() - start
+                self.stdout.write(self.style.MIGRATE_HEADING(name))
+                self.stdout.write(
+                    f'  {elapsed * 1e6 / repeat:.1f} us per request, '
+                    f'{len(statements) / repeat:.3f} queries per request'
+                )
+        finally:
+            invalidate_token(token.key)
+            invalidate_user(auth_user.pk)
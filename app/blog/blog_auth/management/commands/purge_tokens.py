@@ -0,0 +1,39 @@
+from time import sleep
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from rest_framework.authtoken.models import Token
+
+from blog_auth.tokens import expired_tokens
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete expired authentication tokens in chunks, each in its own '
+        'short transaction, so no lock is held for long.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument(
+            '--sleep', type=float, default=0,
+            help='Seconds to pause between chunks.'
+        )
+
+    def handle(self, *args, **options):
+        deleted = 0
+        while True:
+            keys = expired_tokens().values_list('key', flat=True)
+            keys = list(keys[:options['batch_size']])
+            if not keys:
+                break
+            with transaction.atomic():
+                # Checked again, a token may have been used since it was read.
+                _, counts = expired_tokens().filter(key__in=keys).delete()
+            deleted += counts.get(Token._meta.label, 0)
+            if options['verbosity'] >= 2:
+                self.stdout.write(f'{deleted} tokens deleted...')
+            if options['sleep']:
+                sleep(options['sleep'])
+        self.stdout.write(f'Deleted {deleted} expired tokens.')
@@ -1,6 +1,7 @@
 from datetime import date
 
 from django.db import models
+from django.db.models import F
 
 class CreateUserProfilManager(models.Manager):
     
@@ -14,5 +15,29 @@ class CreateUserProfilManager(models.Manager):
         personal_data.save()
         return personal_data
 
+    def change_number_article(self, user_id, delta):
+        """
+        Move the article counter of the blog user by delta with a single
+        UPDATE, so concurrent writers never lose a change. Call it inside
+        the transaction that writes the articles.
+        """
+        profiles = self.filter(user_fk_personal_data__id=user_id)
+        if delta < 0:
+            profiles = profiles.filter(number_article__gte=-delta)
+        return profiles.update(number_article=F('number_article') + delta)
 
-        
\ No newline at end of file
+
+class UserManager(models.Manager):
+
+    def get_for_auth_data(self, auth_data):
+        """
+        Return the blog user of the authenticate data. The result is kept on
+        the auth data instance, so one request resolves it only once.
+        """
+        try:
+            return auth_data.blog_user_cache
+        except AttributeError:
+            auth_data.blog_user_cache = self.get(
+                user_authenticate_data=auth_data
+            )
+            return auth_data.blog_user_cache
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-17 19:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_auth', '0003_auto_20200108_0941'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='personalusersdata',
+            name='number_article',
+            field=models.PositiveIntegerField(default=0, verbose_name='number article'),
+        ),
+    ]
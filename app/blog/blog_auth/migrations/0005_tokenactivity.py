@@ -0,0 +1,29 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authtoken', '0002_auto_20160226_1747'),
+        ('blog_auth', '0004_alter_personalusersdata_number_article'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TokenActivity',
+            fields=[
+                ('token', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='activity', serialize=False, to='authtoken.token')),
+                ('last_used', models.DateTimeField(db_index=True, verbose_name='last used')),
+            ],
+            options={
+                'verbose_name': 'Token activity',
+                'verbose_name_plural': 'Token activities',
+            },
+        ),
+        # Tokens that were never used expire by their creation time.
+        migrations.RunSQL(
+            'CREATE INDEX blog_auth_token_created_idx ON authtoken_token (created)',
+            'DROP INDEX blog_auth_token_created_idx',
+        ),
+    ]
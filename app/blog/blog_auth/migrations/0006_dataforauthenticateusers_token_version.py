@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_auth', '0005_tokenactivity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dataforauthenticateusers',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, help_text='Signed access tokens of an older version are refused.', verbose_name='token version'),
+        ),
+    ]
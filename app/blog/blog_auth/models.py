@@ -6,7 +6,7 @@ from django.core.validators import MinLengthValidator
 
 from pycountry import countries
 
-from .managers import CreateUserProfilManager
+from .managers import CreateUserProfilManager, UserManager
 
 
 class DataForAuthenticateUsers(AbstractUser):
@@ -19,6 +19,11 @@ class DataForAuthenticateUsers(AbstractUser):
             'unique': _("A user with that e-mail already exists."),
         }
     )
+    token_version = models.PositiveIntegerField(
+        verbose_name=_('token version'),
+        help_text=_('Signed access tokens of an older version are refused.'),
+        default=0
+    )
 
     class Meta:
         verbose_name = _('Data for authenticate user')
@@ -67,7 +72,7 @@ class PersonalUsersData(models.Model):
     date_birth = models.DateField(
         verbose_name=_('date of birth')
     )
-    number_article = models.PositiveSmallIntegerField(
+    number_article = models.PositiveIntegerField(
         verbose_name=_('number article'),
         default=0
     )
@@ -92,6 +97,7 @@ class User(models.Model):
         blank=True,
         null=True
     )
+    objects = UserManager()
 
     def get_full_name(self):
         """
@@ -125,3 +131,20 @@ class User(models.Model):
     class Meta:
         verbose_name = _('User')
         verbose_name_plural = _('Users') 
+
+
+class TokenActivity(models.Model):
+    token = models.OneToOneField(
+        to='authtoken.Token',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='activity'
+    )
+    last_used = models.DateTimeField(
+        verbose_name=_('last used'),
+        db_index=True
+    )
+
+    class Meta:
+        verbose_name = _('Token activity')
+        verbose_name_plural = _('Token activities')
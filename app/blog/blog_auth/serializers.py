@@ -3,11 +3,12 @@ from random import sample
 from string import ascii_uppercase, digits, punctuation
 
 from django.contrib.auth import authenticate
-from django.contrib.auth.hashers import check_password
+from django.core import signing
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 
+from . import hashing, tokens
 from .models import DataForAuthenticateUsers, User, PersonalUsersData
 
 class PasswordValidator:
@@ -70,7 +71,6 @@ class AuthTokenSerializer(serializers.Serializer):
             user = authenticate(
                 request=self.context.get('request'),
                 username=username_or_email,
-                email=username_or_email,
                 password=password
             )
         else:
@@ -130,7 +130,7 @@ class RegisterSerializer(serializers.ModelSerializer):
             username=validated_data['username'],
             email=validated_data['email']
         )
-        new_data_for_auth.set_password(validated_data['password1'])
+        hashing.set_password(new_data_for_auth, validated_data['password1'])
         new_data_for_auth.save()
         user = User(user_authenticate_data=new_data_for_auth)
         user.save()
@@ -173,8 +173,9 @@ class ResetPasswordSerializer(serializers.Serializer):
         user_auth_data = self.validated_data['user_auth_data']
         user = User.objects.get(user_authenticate_data=user_auth_data.id)
         new_password = self.get_new_password()
-        user_auth_data.set_password(new_password)
-        user_auth_data.save()
+        hashing.set_password(user_auth_data, new_password)
+        user_auth_data.token_version += 1
+        user_auth_data.save(update_fields=['password', 'token_version'])
         message = f"""
         Hi {user_auth_data.username}.
         You reset your password.
@@ -240,10 +241,42 @@ class CreateProfileUserSerializer(serializers.ModelSerializer):
         return PersonalUsersData.objects.create_profile(**validated_data)
 
 
+class RefreshTokenSerializer(serializers.Serializer):
+    refresh = serializers.CharField(write_only=True)
+
+    def validate_refresh(self, value):
+        try:
+            user_id, version = tokens.read_signed_token(
+                value, tokens.REFRESH_TOKEN_SALT, tokens.get_refresh_lifetime()
+            )
+        except signing.BadSignature:
+            raise serializers.ValidationError(
+                detail="Invalid or expired refresh token."
+            )
+        user = DataForAuthenticateUsers.objects.filter(
+            pk=user_id, is_active=True
+        ).first()
+        if user is None or user.token_version != version:
+            raise serializers.ValidationError(
+                detail="Invalid or expired refresh token."
+            )
+        return user
+
+
 class AccountDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = PersonalUsersData
         exclude = ['id']
+        read_only_fields = ['number_article']
+
+def load_auth_data(request):
+    """
+    Return the auth data of the request user read from the database.
+    request.user may come from the token cache, so it can be stale and has
+    no password hash; account changes check and write this copy instead.
+    """
+    return DataForAuthenticateUsers.objects.get(pk=request.user.pk)
+
 
 class AccountChangePassword(serializers.Serializer):
     old_password = serializers.CharField(
@@ -285,8 +318,8 @@ class AccountChangePassword(serializers.Serializer):
         return validated_data
 
     def validate_old_password(self, data):
-        user_auth_data = self.context.get('request').user
-        if not check_password(password=data, encoded=user_auth_data.password):
+        user_auth_data = load_auth_data(self.context.get('request'))
+        if not hashing.check_user_password(user_auth_data, data):
             raise serializers.ValidationError(
                 detail="Old password mismatch."
             )
@@ -294,9 +327,12 @@ class AccountChangePassword(serializers.Serializer):
 
     def save(self):
         user_auth_data = self.validated_data['old_password']
-        user_auth_data.set_password(self.validated_data['new_password2'])
-        user_auth_data.save()
-        user = User.objects.get(user_authenticate_data=user_auth_data.id)
+        hashing.set_password(
+            user_auth_data, self.validated_data['new_password2']
+        )
+        user_auth_data.token_version += 1
+        user_auth_data.save(update_fields=['password', 'token_version'])
+        user = User.objects.get_for_auth_data(user_auth_data)
         user.email_user(
             subject="Change Password.",
             message="You have changed password if you do not urgently reset the password",
@@ -310,7 +346,7 @@ class AccountChangeEmail(serializers.Serializer):
     new_email2 = serializers.EmailField()
 
     def validate_old_email(self, data):
-        user_auth_data = self.context.get('request').user
+        user_auth_data = load_auth_data(self.context.get('request'))
         if user_auth_data.email != data:
             raise serializers.ValidationError(
                 detail="Old email mismatch."
@@ -333,8 +369,8 @@ class AccountChangeEmail(serializers.Serializer):
     def save(self):
         user_auth_data = self.validated_data['old_email']
         user_auth_data.email = self.validated_data['new_email1']
-        user_auth_data.save()
-        user = User.objects.get(user_authenticate_data=user_auth_data.id)
+        user_auth_data.save(update_fields=['email'])
+        user = User.objects.get_for_auth_data(user_auth_data)
         user.email_user(
             subject="Change Email.",
             message="You have changed email if you do not urgently write to support.",
@@ -0,0 +1,36 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from rest_framework.authtoken.models import Token
+
+from .authentication import invalidate_token, invalidate_user
+from .models import DataForAuthenticateUsers, User
+
+
+def invalidate_user_tokens(auth_user_id):
+    invalidate_user(auth_user_id)
+    keys = Token.objects.filter(user_id=auth_user_id).values_list(
+        'key', flat=True
+    )
+    for key in keys:
+        invalidate_token(key)
+
+
+@receiver([post_save, post_delete], sender=DataForAuthenticateUsers)
+def invalidate_auth_user_tokens(
+    sender, instance, update_fields=None, **kwargs
+):
+    # Logging in only touches last_login, which the cache does not care about.
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    invalidate_user_tokens(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_blog_user_tokens(sender, instance, **kwargs):
+    invalidate_user_tokens(instance.user_authenticate_data_id)
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    invalidate_token(instance.key)
@@ -1,53 +1,93 @@
-from django.test import TestCase
-from django.contrib.auth.hashers import check_password
+from unittest import mock
 
-from blog_auth.authentication import EmailAuthBackend
+from django.test import TestCase, override_settings
+from django.contrib.auth.hashers import MD5PasswordHasher
+
+from blog_auth.authentication import UsernameOrEmailBackend
 from blog_auth.models import DataForAuthenticateUsers
 
 
-class TestEmailAuthBackend(TestCase):
-    
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']
+)
+class TestUsernameOrEmailBackend(TestCase):
+
     def setUp(self):
         self.password = 'Tester123,.'
-        self.data = {
-            'username': 'tester',
-            'email': 'tester123@gmail.com',
-        }
-        self.user = DataForAuthenticateUsers(**self.data)
+        self.user = DataForAuthenticateUsers(
+            username='tester', email='tester123@gmail.com'
+        )
         self.user.set_password(self.password)
         self.user.save()
-        self.backend = EmailAuthBackend
-
-    def with_correct_email(self):
-        test = self.backend()
-        user = test.authenticate(
-            request=None, 
-            email=self.data['email'],
-            password=self.password
+        self.backend = UsernameOrEmailBackend()
+
+    def authenticate(self, login, password):
+        return self.backend.authenticate(
+            request=None, username=login, password=password
         )
-        self.assertEqual(user.email, self.data['email'])
-        self.assertEqual(user.username, self.data['username'])
-        self.assertTrue(
-            check_password(
-                password=self.password,
-                encoded=user.password
-            )
+
+    def test_with_username(self):
+        self.assertEqual(self.authenticate('tester', self.password), self.user)
+
+    def test_with_email_in_other_case(self):
+        self.assertEqual(
+            self.authenticate('Tester123@Gmail.com', self.password), self.user
         )
 
-    def test_with_bad_email(self):
-        test = self.backend()
-        user = test.authenticate(
-            request=None, 
-            email='bad_email',
-            password=self.password
+    def test_with_email_keyword(self):
+        user = self.backend.authenticate(
+            request=None, email='tester123@gmail.com', password=self.password
         )
-        self.assertIsNone(user)
+        self.assertEqual(user, self.user)
+
+    def test_with_unknown_login(self):
+        self.assertIsNone(self.authenticate('bad_email', self.password))
 
     def test_with_bad_password(self):
-        test = self.backend()
-        user = test.authenticate(
-            request=None, 
-            email=self.data['email'],
-            password='bad_password'
+        self.assertIsNone(self.authenticate('tester', 'bad_password'))
+
+    def test_with_inactive_user(self):
+        self.user.is_active = False
+        self.user.save()
+        self.assertIsNone(self.authenticate('tester', self.password))
+
+    def test_email_wins_over_username_of_other_user(self):
+        # Registering the email of someone else as a username must not lock
+        # them out of their email login.
+        response = self.authenticate('tester123@gmail.com', self.password)
+        self.assertEqual(response, self.user)
+        attacker = DataForAuthenticateUsers(
+            username='tester123@gmail.com', email='attacker@gmail.com'
         )
-        self.assertIsNone(user)
+        attacker.set_password('Other123,.')
+        attacker.save()
+        response = self.authenticate('tester123@gmail.com', self.password)
+        self.assertEqual(response, self.user)
+        response = self.authenticate('tester123@gmail.com', 'Other123,.')
+        self.assertIsNone(response)
+
+    def test_username_wins_over_email_without_at_sign(self):
+        other = DataForAuthenticateUsers(
+            username='other', email='tester'
+        )
+        other.set_password('Other123,.')
+        other.save()
+        self.assertEqual(self.authenticate('tester', self.password), self.user)
+
+    def test_resolves_login_with_one_query(self):
+        with self.assertNumQueries(1):
+            self.authenticate('tester123@gmail.com', self.password)
+
+    def test_hashes_once(self):
+        for login, password in [
+            ('tester', self.password),
+            ('tester', 'bad_password'),
+            ('nobody', self.password),
+        ]:
+            with self.subTest(login=login, password=password):
+                with mock.patch(
+                    'django.contrib.auth.hashers.MD5PasswordHasher.encode',
+                    autospec=True, side_effect=MD5PasswordHasher.encode
+                ) as encode:
+                    self.authenticate(login, password)
+                self.assertEqual(encode.call_count, 1)
@@ -0,0 +1,119 @@
+import asyncio
+from threading import Event
+
+from django.contrib.auth.hashers import make_password as django_make_password
+from django.test import override_settings
+
+from rest_framework.test import APITestCase
+from rest_framework.reverse import reverse
+from rest_framework.authtoken.models import Token
+
+from blog_auth import hashing
+from blog_auth.hashing import HashingPoolFull, hashing_pool
+from blog_auth.models import DataForAuthenticateUsers, User
+
+
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']
+)
+class TestHashingPool(APITestCase):
+    def setUp(self):
+        hashing_pool.reset_stats()
+        self.password = "Tester123.,"
+        data_for_auth = DataForAuthenticateUsers(
+            username="tester1996",
+            email="test_django@gmail.com"
+        )
+        data_for_auth.set_password(self.password)
+        data_for_auth.save()
+        self.data_for_auth = data_for_auth
+        User.objects.create(user_authenticate_data=data_for_auth)
+
+    def block_pool(self):
+        """Occupy the only worker until the returned event is set."""
+        release = Event()
+        future = hashing_pool.submit(release.wait)
+        self.addCleanup(future.result)
+        self.addCleanup(release.set)
+        return release
+
+    def test_make_and_check_password(self):
+        encoded = hashing.make_password(self.password)
+        self.assertTrue(hashing.check_password(self.password, encoded))
+        self.assertFalse(hashing.check_password('bad_password', encoded))
+        stats = hashing_pool.stats()
+        self.assertEqual(stats['submitted'], 3)
+        self.assertEqual(stats['completed'], 3)
+        self.assertEqual(stats['in_flight'], 0)
+
+    def test_async_check_password(self):
+        encoded = asyncio.run(hashing.amake_password(self.password))
+        self.assertTrue(
+            asyncio.run(hashing.acheck_password(self.password, encoded))
+        )
+
+    @override_settings(PASSWORD_HASHING_WORKERS=0)
+    def test_inline_without_workers(self):
+        self.assertTrue(
+            hashing.check_password(self.password, self.data_for_auth.password)
+        )
+        self.assertEqual(hashing_pool.stats()['submitted'], 0)
+
+    @override_settings(
+        PASSWORD_HASHING_WORKERS=1, PASSWORD_HASHING_QUEUE_SIZE=0
+    )
+    def test_full_queue_is_refused(self):
+        self.block_pool()
+        with self.assertRaises(HashingPoolFull):
+            hashing.make_password(self.password)
+        stats = hashing_pool.stats()
+        self.assertEqual(stats['rejected'], 1)
+        self.assertEqual(stats['in_flight'], 1)
+
+    @override_settings(
+        PASSWORD_HASHING_WORKERS=1, PASSWORD_HASHING_QUEUE_SIZE=0
+    )
+    def test_login_when_queue_is_full(self):
+        self.block_pool()
+        response = self.client.post(
+            path=reverse("login-list"),
+            data={
+                "username_or_email": "tester1996",
+                "password": self.password
+            },
+            format="json"
+        )
+        self.assertEqual(response.status_code, 503)
+
+    @override_settings(PASSWORD_HASHERS=[
+        'django.contrib.auth.hashers.SHA1PasswordHasher',
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ])
+    def test_outdated_hash_is_upgraded(self):
+        self.data_for_auth.password = django_make_password(
+            self.password, hasher='md5'
+        )
+        self.data_for_auth.save()
+        self.assertTrue(
+            hashing.check_user_password(self.data_for_auth, self.password)
+        )
+        self.data_for_auth.refresh_from_db()
+        self.assertTrue(self.data_for_auth.password.startswith('sha1$'))
+
+    def test_stats_for_admins_only(self):
+        hashing.make_password(self.password)
+        token = Token.objects.create(user=self.data_for_auth)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        response = self.client.get(reverse("hashing-list"))
+        self.assertEqual(response.status_code, 403)
+        admin = DataForAuthenticateUsers.objects.create_superuser(
+            username="admin1996",
+            email="admin@example.com",
+            password="Admin1996.,"
+        )
+        token = Token.objects.create(user=admin)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        response = self.client.get(reverse("hashing-list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["submitted"], 1)
+        self.assertEqual(response.json()["rejected"], 0)
@@ -124,3 +124,26 @@ class TestLoginView(APITestCase):
             response.json()['password'][0], 
             'This field is required.'
         )
+
+    def test_email_as_username_of_other_user(self):
+        response = self.client.post(
+            path=reverse("registration-list"),
+            data={
+                "username": "test_django@gmail.com",
+                "email": "attacker@gmail.com",
+                "password1": "Attacker123.,",
+                "password2": "Attacker123.,"
+            },
+            format="json"
+        )
+        self.assertEqual(response.status_code, 201)
+        response = self.client.post(
+            path=reverse("login-list"),
+            data={
+                "username_or_email": "test_django@gmail.com",
+                "password": "Tester123.,"
+            },
+            format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['token'], self.token.key)
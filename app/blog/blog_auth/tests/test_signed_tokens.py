@@ -0,0 +1,118 @@
+from datetime import timedelta
+
+from django.core import signing
+from django.core.cache import cache
+from django.test import override_settings
+
+from rest_framework.test import APITestCase
+from rest_framework.reverse import reverse
+
+from blog_auth.authentication import token_cache
+from blog_auth.models import DataForAuthenticateUsers, User
+from blog_auth.tokens import ACCESS_TOKEN_SALT
+
+
+@override_settings(SIGNED_TOKENS=True)
+class TestSignedTokens(APITestCase):
+    def setUp(self):
+        cache.clear()
+        token_cache.clear()
+        self.data_for_auth = DataForAuthenticateUsers(
+            username="tester1996",
+            email="tester@example.com"
+        )
+        self.data_for_auth.set_password("Tester123.,")
+        self.data_for_auth.save()
+        User.objects.create(user_authenticate_data=self.data_for_auth)
+
+    def login(self):
+        response = self.client.post(
+            path=reverse("login-list"),
+            data={
+                "username_or_email": "tester1996",
+                "password": "Tester123.,"
+            },
+            format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def get_account(self, access):
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + access)
+        return self.client.get(reverse("account_user-list"))
+
+    def refresh(self, refresh):
+        self.client.credentials()
+        return self.client.post(
+            reverse("refresh-list"), data={"refresh": refresh}, format="json"
+        )
+
+    def test_login_returns_both_kinds(self):
+        data = self.login()
+        self.assertEqual(set(data), {"token", "access", "refresh"})
+
+    @override_settings(SIGNED_TOKENS=False)
+    def test_disabled(self):
+        self.assertEqual(set(self.login()), {"token"})
+        self.assertEqual(self.refresh("anything").status_code, 404)
+
+    def test_access_token_without_database(self):
+        access = self.login()["access"]
+        self.get_account(access)
+        with self.assertNumQueries(0):
+            response = self.get_account(access)
+        self.assertEqual(response.status_code, 200)
+
+    def test_tampered_access_token(self):
+        access = self.login()["access"]
+        last = "A" if access[-1] != "A" else "B"
+        response = self.get_account(access[:-1] + last)
+        self.assertEqual(response.status_code, 401)
+
+    def test_refresh_token_is_not_an_access_token(self):
+        refresh = self.login()["refresh"]
+        self.assertEqual(self.get_account(refresh).status_code, 401)
+
+    @override_settings(ACCESS_TOKEN_LIFETIME=timedelta(seconds=-1))
+    def test_expired_access_token(self):
+        response = self.get_account(self.login()["access"])
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(
+            response.json()["detail"], "Access token has expired."
+        )
+
+    def test_refresh(self):
+        refresh = self.login()["refresh"]
+        response = self.refresh(refresh)
+        self.assertEqual(response.status_code, 200)
+        response = self.get_account(response.json()["access"])
+        self.assertEqual(response.status_code, 200)
+
+    def test_invalid_refresh(self):
+        access = self.login()["access"]
+        self.assertEqual(self.refresh(access).status_code, 400)
+
+    def test_password_change_revokes_tokens(self):
+        tokens = self.login()
+        self.get_account(tokens["access"])
+        response = self.client.put(
+            path=reverse("account_user-change-password"),
+            data={
+                "old_password": "Tester123.,",
+                "new_password1": "NewPassword12.,",
+                "new_password2": "NewPassword12.,"
+            }
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.get_account(tokens["access"])
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(
+            response.json()["detail"], "Access token has been revoked."
+        )
+        self.assertEqual(self.refresh(tokens["refresh"]).status_code, 400)
+
+    def test_unknown_user(self):
+        access = signing.dumps(
+            {"u": self.data_for_auth.pk + 1, "v": 0}, salt=ACCESS_TOKEN_SALT
+        )
+        self.assertEqual(self.get_account(access).status_code, 401)
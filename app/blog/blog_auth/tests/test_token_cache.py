@@ -0,0 +1,169 @@
+import pickle
+from datetime import date
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from rest_framework.test import APITestCase
+from rest_framework.reverse import reverse
+from rest_framework.authtoken.models import Token
+
+from blog_auth.authentication import TokenCache, token_cache
+from blog_auth.models import DataForAuthenticateUsers, PersonalUsersData, User
+
+
+class TestCachedTokenAuthentication(APITestCase):
+    def setUp(self):
+        cache.clear()
+        token_cache.clear()
+        self.data_for_auth = DataForAuthenticateUsers(
+            username="tester1996",
+            email="tester@example.com"
+        )
+        self.data_for_auth.set_password("Tester1996.,")
+        self.data_for_auth.save()
+        self.user = User.objects.create(
+            user_authenticate_data=self.data_for_auth,
+            user_personal_data=PersonalUsersData.objects.create(
+                first_name="Przemyslaw",
+                last_name="Rozycki",
+                nick="TeKa",
+                date_birth=date(1996, 10, 12)
+            )
+        )
+        self.token, _ = Token.objects.get_or_create(user=self.data_for_auth)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+
+    def get_account(self):
+        return self.client.get(reverse("account_user-list"))
+
+    def test_second_request_does_not_query_users(self):
+        self.get_account()
+        # Only the personal data of the account itself is read.
+        with self.assertNumQueries(1):
+            response = self.get_account()
+        self.assertEqual(response.json()["nick"], "TeKa")
+
+    def test_shared_cache_is_used_by_other_processes(self):
+        self.get_account()
+        token_cache.clear()
+        with self.assertNumQueries(1):
+            self.get_account()
+
+    def test_invalid_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + 40 * "0")
+        self.assertEqual(self.get_account().status_code, 401)
+
+    def test_deleted_token(self):
+        self.get_account()
+        self.token.delete()
+        self.assertEqual(self.get_account().status_code, 401)
+
+    def test_inactive_user(self):
+        self.get_account()
+        self.data_for_auth.is_active = False
+        self.data_for_auth.save()
+        self.assertEqual(self.get_account().status_code, 401)
+
+    def test_changed_email_is_seen(self):
+        self.get_account()
+        response = self.client.put(
+            path=reverse("account_user-change-email"),
+            data={
+                "old_email": "tester@example.com",
+                "new_email1": "new_email@example.com",
+                "new_email2": "new_email@example.com",
+            }
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.client.put(
+            path=reverse("account_user-change-email"),
+            data={
+                "old_email": "new_email@example.com",
+                "new_email1": "newer_email@example.com",
+                "new_email2": "newer_email@example.com",
+            }
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_changed_password_is_seen(self):
+        self.get_account()
+        for old, new in (
+            ("Tester1996.,", "NewPassword12.,"),
+            ("NewPassword12.,", "Newer1996.,"),
+        ):
+            response = self.client.put(
+                path=reverse("account_user-change-password"),
+                data={
+                    "old_password": old,
+                    "new_password1": new,
+                    "new_password2": new
+                }
+            )
+            self.assertEqual(response.status_code, 200)
+
+    def test_stale_snapshot_does_not_undo_password_change(self):
+        self.get_account()
+        # What another process still holds in its in-process cache.
+        stale = dict(token_cache.entries)
+        response = self.client.put(
+            path=reverse("account_user-change-password"),
+            data={
+                "old_password": "Tester1996.,",
+                "new_password1": "NewPassword12.,",
+                "new_password2": "NewPassword12.,"
+            }
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(token_cache.entries, {})
+        token_cache.entries.update(stale)
+        response = self.client.put(
+            path=reverse("account_user-change-email"),
+            data={
+                "old_email": "tester@example.com",
+                "new_email1": "new_email@example.com",
+                "new_email2": "new_email@example.com"
+            }
+        )
+        self.assertEqual(response.status_code, 200)
+        self.data_for_auth.refresh_from_db()
+        self.assertTrue(self.data_for_auth.check_password("NewPassword12.,"))
+        self.assertEqual(self.data_for_auth.token_version, 1)
+        self.assertEqual(self.data_for_auth.email, "new_email@example.com")
+        self.assertIsNone(cache.get(next(iter(stale))))
+
+    def test_cached_user_has_no_password_hash(self):
+        self.get_account()
+        (pickled,) = (value for _, value in token_cache.entries.values())
+        auth_user, _, _ = pickle.loads(pickled)
+        self.assertIsNone(auth_user.password)
+
+    def test_superuser_without_blog_user(self):
+        admin = DataForAuthenticateUsers.objects.create_superuser(
+            username="admin1996",
+            email="admin@example.com",
+            password="Admin1996.,"
+        )
+        token = Token.objects.create(user=admin)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        response = self.client.get(reverse("article-export"))
+        self.assertEqual(response.status_code, 200)
+
+
+class TestTokenCache(APITestCase):
+    @override_settings(TOKEN_CACHE_SIZE=2)
+    def test_least_recently_used_is_evicted(self):
+        lru = TokenCache()
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+        self.assertEqual(
+            (lru.get("a"), lru.get("b"), lru.get("c")), (1, None, 3)
+        )
+
+    @override_settings(TOKEN_CACHE_LOCAL_TIMEOUT=-1)
+    def test_entries_expire(self):
+        lru = TokenCache()
+        lru.set("a", 1)
+        self.assertIsNone(lru.get("a"))
@@ -0,0 +1,118 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils.timezone import now
+
+from rest_framework.test import APITestCase
+from rest_framework.reverse import reverse
+from rest_framework.authtoken.models import Token
+
+from blog_auth.authentication import token_cache
+from blog_auth.models import DataForAuthenticateUsers, TokenActivity, User
+
+
+@override_settings(
+    TOKEN_IDLE_TIMEOUT=timedelta(days=14),
+    TOKEN_REFRESH_INTERVAL=timedelta(hours=1)
+)
+class TestTokenExpiry(APITestCase):
+    def setUp(self):
+        cache.clear()
+        token_cache.clear()
+        self.data_for_auth = self.create_auth_user("tester1996")
+        self.token, _ = Token.objects.get_or_create(user=self.data_for_auth)
+
+    def create_auth_user(self, username):
+        data_for_auth = DataForAuthenticateUsers(
+            username=username,
+            email=f"{username}@example.com"
+        )
+        data_for_auth.set_password("Tester123.,")
+        data_for_auth.save()
+        User.objects.create(user_authenticate_data=data_for_auth)
+        return data_for_auth
+
+    def set_last_used(self, token, age):
+        TokenActivity.objects.update_or_create(
+            token=token, defaults={"last_used": now() - age}
+        )
+        cache.clear()
+        token_cache.clear()
+
+    def get_account(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        return self.client.get(reverse("account_user-list"))
+
+    def login(self):
+        return self.client.post(
+            path=reverse("login-list"),
+            data={
+                "username_or_email": "tester1996",
+                "password": "Tester123.,"
+            },
+            format="json"
+        )
+
+    def test_login_records_use(self):
+        response = self.login()
+        self.assertEqual(response.json()["token"], self.token.key)
+        self.assertTrue(
+            TokenActivity.objects.filter(token=self.token).exists()
+        )
+
+    def test_expired_token_is_refused(self):
+        self.set_last_used(self.token, timedelta(days=15))
+        response = self.get_account(self.token)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()["detail"], "Token has expired.")
+
+    def test_never_used_token_expires_by_creation(self):
+        Token.objects.filter(pk=self.token.pk).update(
+            created=now() - timedelta(days=15)
+        )
+        self.assertEqual(self.get_account(self.token).status_code, 401)
+
+    def test_login_replaces_expired_token(self):
+        self.set_last_used(self.token, timedelta(days=15))
+        key = self.login().json()["token"]
+        self.assertNotEqual(key, self.token.key)
+        self.assertFalse(Token.objects.filter(pk=self.token.pk).exists())
+
+    def test_use_is_written_once_per_interval(self):
+        self.set_last_used(self.token, timedelta(hours=2))
+        self.get_account(self.token)
+        last_used = TokenActivity.objects.get(token=self.token).last_used
+        self.assertLess(now() - last_used, timedelta(minutes=1))
+        token_cache.clear()
+        # The refreshed use was stored in the shared cache as well.
+        with self.assertNumQueries(0):
+            self.get_account(self.token)
+
+    def test_recent_use_is_not_written(self):
+        self.set_last_used(self.token, timedelta(minutes=5))
+        last_used = TokenActivity.objects.get(token=self.token).last_used
+        self.get_account(self.token)
+        with self.assertNumQueries(0):
+            self.get_account(self.token)
+        self.assertEqual(
+            TokenActivity.objects.get(token=self.token).last_used, last_used
+        )
+
+    def test_purge_command(self):
+        self.set_last_used(self.token, timedelta(days=15))
+        fresh = Token.objects.create(user=self.create_auth_user("fresh1996"))
+        never_used = Token.objects.create(
+            user=self.create_auth_user("old1996")
+        )
+        Token.objects.filter(pk=never_used.pk).update(
+            created=now() - timedelta(days=30)
+        )
+        out = StringIO()
+        call_command("purge_tokens", "--batch-size", "1", stdout=out)
+        self.assertIn("Deleted 2 expired tokens.", out.getvalue())
+        self.assertEqual(
+            list(Token.objects.values_list("key", flat=True)), [fresh.key]
+        )
@@ -0,0 +1,118 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+from django.utils.timezone import now
+
+from rest_framework.authtoken.models import Token
+
+from .models import TokenActivity
+
+ACCESS_TOKEN_SALT = 'blog_auth.tokens.access'
+REFRESH_TOKEN_SALT = 'blog_auth.tokens.refresh'
+
+
+def get_idle_timeout():
+    """Tokens unused for this long expire."""
+    return getattr(settings, 'TOKEN_IDLE_TIMEOUT', timedelta(days=14))
+
+
+def get_refresh_interval():
+    """last_used is written at most once per this interval and token."""
+    return getattr(settings, 'TOKEN_REFRESH_INTERVAL', timedelta(hours=1))
+
+
+def is_expired(last_used, moment=None):
+    return last_used + get_idle_timeout() < (moment or now())
+
+
+def needs_refresh(last_used, moment=None):
+    return (moment or now()) - last_used >= get_refresh_interval()
+
+
+def get_last_used(token):
+    """Return when token was last used, its creation time if never."""
+    try:
+        return token.activity.last_used
+    except TokenActivity.DoesNotExist:
+        return token.created
+
+
+def touch(key, moment=None):
+    """
+    Record a use of the token key with one UPDATE, or an INSERT the first
+    time.
+    """
+    moment = moment or now()
+    if not TokenActivity.objects.filter(token_id=key).update(last_used=moment):
+        TokenActivity.objects.get_or_create(
+            token_id=key, defaults={'last_used': moment}
+        )
+    return moment
+
+
+def expired_tokens(moment=None):
+    """
+    Return the expired tokens. Both branches of the condition are served by
+    an index: TokenActivity.last_used, and authtoken_token.created for
+    tokens that were never used.
+    """
+    cutoff = (moment or now()) - get_idle_timeout()
+    unused_since = Q(activity__last_used__lt=cutoff)
+    never_used = Q(activity__isnull=True, created__lt=cutoff)
+    return Token.objects.filter(unused_since | never_used)
+
+
+def get_valid_token(user):
+    """
+    Return the token of user for a login, replacing it when it expired,
+    and record the login as a use.
+    """
+    token = Token.objects.select_related('activity').filter(user=user).first()
+    if token is not None and is_expired(get_last_used(token)):
+        token.delete()
+        token = None
+    if token is None:
+        token = Token.objects.create(user=user)
+    touch(token.key)
+    return token
+
+
+def signed_tokens_enabled():
+    return getattr(settings, 'SIGNED_TOKENS', False)
+
+
+def get_access_lifetime():
+    return getattr(settings, 'ACCESS_TOKEN_LIFETIME', timedelta(minutes=15))
+
+
+def get_refresh_lifetime():
+    return getattr(settings, 'REFRESH_TOKEN_LIFETIME', timedelta(days=14))
+
+
+def make_signed_token(user, salt):
+    """
+    Sign the user id and token version of user with SECRET_KEY. The token is
+    timestamped, its lifetime is checked when it is read.
+    """
+    return signing.dumps({'u': user.pk, 'v': user.token_version}, salt=salt)
+
+
+def read_signed_token(value, salt, max_age):
+    """
+    Return the (user id, token version) signed in value. Raise
+    signing.SignatureExpired or signing.BadSignature when it is not valid.
+    """
+    payload = signing.loads(value, salt=salt, max_age=max_age)
+    try:
+        return int(payload['u']), int(payload['v'])
+    except (KeyError, TypeError, ValueError):
+        raise signing.BadSignature('Malformed token payload.')
+
+
+def issue_signed_tokens(user):
+    return {
+        'access': make_signed_token(user, ACCESS_TOKEN_SALT),
+        'refresh': make_signed_token(user, REFRESH_TOKEN_SALT),
+    }
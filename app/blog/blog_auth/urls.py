@@ -2,13 +2,18 @@ from django.urls import include, path
 
 from rest_framework.routers import DefaultRouter
 
-from .views import RegistrationView, LoginView, ResetPasswordView, AccountView
+from .views import (
+    RegistrationView, LoginView, RefreshTokenView, ResetPasswordView,
+    AccountView, HashingStatsView
+)
 
 ROUTER = DefaultRouter()
 ROUTER.register(r'registration', RegistrationView, basename='registration')
 ROUTER.register(r'login', LoginView, basename='login')
+ROUTER.register(r'refresh', RefreshTokenView, basename='refresh')
 ROUTER.register(r'reset_password', ResetPasswordView, basename='reset_password')
 ROUTER.register(r'account', AccountView, basename="account_user")
+ROUTER.register(r'hashing', HashingStatsView, basename='hashing')
 
 urlpatterns = [
     path('', include(ROUTER.urls)),
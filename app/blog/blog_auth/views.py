@@ -1,18 +1,20 @@
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.mixins import CreateModelMixin
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet, ViewSet
-from rest_framework.authtoken.models import Token
 
 from .serializers import (
     AuthTokenSerializer, RegisterSerializer, ResetPasswordSerializer,
     AccountDetailSerializer, AccountChangePassword, AccountChangeEmail,
-    CreateProfileUserSerializer
+    CreateProfileUserSerializer, RefreshTokenSerializer
 )
+from .hashing import hashing_pool
 from .models import User
 from .permisions import IsNotAuthenticated
+from .tokens import get_valid_token, issue_signed_tokens, signed_tokens_enabled
 
 
 class LoginView(ViewSet):
@@ -23,8 +25,38 @@ class LoginView(ViewSet):
                                            context={'request': request})
         serializer.is_valid(raise_exception=True)
         user = serializer.validated_data['user']
-        token, _ = Token.objects.get_or_create(user=user)
-        return Response({'token': token.key})
+        token = get_valid_token(user)
+        data = {'token': token.key}
+        if signed_tokens_enabled():
+            data.update(issue_signed_tokens(user))
+        return Response(data)
+
+
+class RefreshTokenView(ViewSet):
+    """
+    Exchange a signed refresh token for a new access and refresh token pair.
+    """
+    serializer_class = RefreshTokenSerializer
+
+    def create(self, request, *args, **kwargs):
+        if not signed_tokens_enabled():
+            raise NotFound()
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response(
+            issue_signed_tokens(serializer.validated_data['refresh'])
+        )
+
+
+class HashingStatsView(ViewSet):
+    """
+    Counters of the password hashing pool of this process: queue depth,
+    rejected hashes and time spent waiting and hashing.
+    """
+    permission_classes = [IsAdminUser]
+
+    def list(self, request, *args, **kwargs):
+        return Response(hashing_pool.stats())
 
 
 class RegistrationView(CreateModelMixin,
@@ -53,7 +85,7 @@ class AccountView(GenericViewSet):
 
     def list(self, request, *args, **kwargs):
         data_auth_user = request.user
-        user = User.objects.get(user_authenticate_data=data_auth_user)
+        user = User.objects.get_for_auth_data(data_auth_user)
         serializer = self.get_serializer_class()(user.user_personal_data)
         return Response(serializer.data)
 
@@ -61,9 +93,11 @@ class AccountView(GenericViewSet):
         serializer = self.get_serializer_class()(data=request.data)
         serializer.is_valid(raise_exception=True)
         auth_data = request.user
-        user = User.objects.get(user_authenticate_data=auth_data.id)
-        user.user_personal_data = serializer.save()
-        user.save()
+        user = User.objects.get_for_auth_data(auth_data)
+        user.user_personal_data = serializer.save(
+            number_article=user.article_set.count()
+        )
+        user.save(update_fields=['user_personal_data'])
         data = dict(serializer.data)
         data["date_birth"] = user.user_personal_data.date_birth
         return Response(
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class BlogEntriesConfig(AppConfig):
     name = 'blog_entries'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,68 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from .views import ArticleViewSet
+
+_executor = None
+_executor_lock = Lock()
+
+_list_view = ArticleViewSet.as_view({'get': 'list'})
+_detail_view = ArticleViewSet.as_view({'get': 'retrieve'})
+
+
+def get_executor():
+    """
+    Return the thread pool the async article views run their database work
+    on. Its size bounds the number of database connections they hold.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'ASYNC_ARTICLE_WORKERS', 8),
+                thread_name_prefix='article-read'
+            )
+        return _executor
+
+
+def _run_view(view, request, kwargs):
+    close_old_connections()
+    try:
+        response = view(request, **kwargs)
+        if hasattr(response, 'render') and callable(response.render):
+            response.render()
+        return response
+    finally:
+        close_old_connections()
+
+
+async def _call(view, request, **kwargs):
+    """
+    Run view, rendering included, on the article thread pool.
+
+    Django 3.2 has no async ORM, and under ASGI it runs every sync view on one
+    shared thread. Here the event loop only awaits the pool, so reads of
+    different requests run in parallel while slow clients hold no thread.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(), partial(_run_view, view, request, kwargs)
+    )
+
+
+async def article_list(request):
+    """
+    Async counterpart of the ArticleViewSet list, with the same query
+    parameters.
+    """
+    return await _call(_list_view, request)
+
+
+async def article_detail(request, pk):
+    """Async counterpart of the ArticleViewSet retrieve."""
+    return await _call(_detail_view, request, pk=pk)
@@ -0,0 +1,88 @@
+from collections import Counter
+from io import StringIO
+
+from django.db import connection, transaction
+
+from blog_auth.models import PersonalUsersData
+from .cache import invalidate_article
+from .models import Article
+from .search import index_articles, index_new_articles
+
+
+def bulk_insert_articles(articles, batch_size=None, use_copy=False):
+    """
+    Insert unsaved articles in one transaction, with bulk_create or, on
+    PostgreSQL and when use_copy is set, with COPY.
+
+    Neither sends post_save, so the summary columns, the search index, the
+    article counters and the cache are taken care of here.
+    """
+    for article in articles:
+        article.update_summary()
+    with transaction.atomic():
+        if use_copy and connection.vendor == 'postgresql':
+            copy_articles(articles)
+        else:
+            articles = Article.objects.bulk_create(
+                articles, batch_size=batch_size
+            )
+            if all(article.pk for article in articles):
+                index_articles(articles, created=True)
+            else:
+                index_new_articles()
+        numbers = Counter(article.author_id for article in articles)
+        for author_id, number in numbers.items():
+            if author_id is not None:
+                PersonalUsersData.objects.change_number_article(
+                    author_id, number
+                )
+        invalidate_article()
+    return articles
+
+
+COPY_ESCAPES = str.maketrans({
+    '\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'
+})
+
+
+def copy_value(value):
+    """Return value as a field of COPY's text format, with None as NULL."""
+    if value is None:
+        return '\\N'
+    return str(value).translate(COPY_ESCAPES)
+
+
+def copy_articles(articles):
+    """
+    Stream articles into PostgreSQL with COPY ... FROM STDIN. The search
+    vector trigger fires for copied rows too. Primary keys are not set on
+    the instances.
+
+    The text format is used rather than CSV, whose writer can not tell an
+    empty string from NULL.
+    """
+    fields = [
+        field for field in Article._meta.concrete_fields
+        if not field.primary_key
+    ]
+    buffer = StringIO()
+    for article in articles:
+        values = (
+            field.get_db_prep_save(
+                field.pre_save(article, add=True), connection
+            )
+            for field in fields
+        )
+        buffer.write('\t'.join(copy_value(value) for value in values))
+        buffer.write('\n')
+    buffer.seek(0)
+    columns = ', '.join(
+        connection.ops.quote_name(field.column) for field in fields
+    )
+    table = connection.ops.quote_name(Article._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table} ({columns}) FROM STDIN "
+            f"WITH (FORMAT text, NULL '\\N')",
+            buffer
+        )
@@ -0,0 +1,138 @@
+from hashlib import md5
+from time import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from .models import Article
+
+LIST_VERSION_KEY = 'article:list:version'
+DETAIL_VERSION_KEY = 'article:detail:version:{pk}'
+LEADERBOARD_VERSION_KEY = 'article:leaderboard:version'
+
+
+def get_cache():
+    return caches[getattr(settings, 'ARTICLE_CACHE_ALIAS', 'default')]
+
+
+def get_timeout():
+    return getattr(settings, 'ARTICLE_CACHE_TIMEOUT', 300)
+
+
+def get_leaderboard_timeout():
+    return getattr(settings, 'ARTICLE_LEADERBOARD_TIMEOUT', 60)
+
+
+def _new_version():
+    """
+    Versions start from the current time, so a version key that was evicted
+    never comes back with a number that older entries were stored under.
+    """
+    return int(time() * 1000)
+
+
+def _get_version(key):
+    cache = get_cache()
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version(), None)
+        version = cache.get(key, _new_version())
+    return version
+
+
+def _bump_version(key):
+    cache = get_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _new_version(), None)
+
+
+def list_cache_key(request):
+    """Return the cache key of one list page, including its query string."""
+    url = md5(request.build_absolute_uri().encode('utf-8')).hexdigest()
+    return f'article:list:{_get_version(LIST_VERSION_KEY)}:{url}'
+
+
+def detail_cache_key(request, pk):
+    version = _get_version(DETAIL_VERSION_KEY.format(pk=pk))
+    url = md5(request.build_absolute_uri().encode('utf-8')).hexdigest()
+    return f'article:detail:{pk}:{version}:{url}'
+
+
+def leaderboard_cache_key(period, limit):
+    """
+    Return the cache key of one leaderboard. Votes do not bump its version,
+    the board is allowed to lag behind them by the leaderboard timeout.
+    """
+    version = _get_version(LEADERBOARD_VERSION_KEY)
+    return f'article:leaderboard:{version}:{period}:{limit}'
+
+
+def make_etag(request, *parts):
+    """
+    Build a strong ETag from parts. The Accept header takes part, as the
+    JSON and the browsable representations differ.
+    """
+    parts = [str(part) for part in parts]
+    parts.append(request.META.get('HTTP_ACCEPT', ''))
+    return '"%s"' % md5(':'.join(parts).encode('utf-8')).hexdigest()
+
+
+def list_etag(request):
+    return make_etag(
+        request, _get_version(LIST_VERSION_KEY), request.build_absolute_uri()
+    )
+
+
+def get_updated_at(pk):
+    """
+    Return the updated_at of an article, or None when it does not exist.
+    The value is cached under the article version, so it never goes stale.
+
+    A version key is only created once the article was found, so requests
+    for missing or malformed pks leave nothing behind in the cache.
+    """
+    try:
+        pk = int(pk)
+    except (TypeError, ValueError):
+        return None
+    cache = get_cache()
+    version = cache.get(DETAIL_VERSION_KEY.format(pk=pk))
+    if version is not None:
+        updated_at = cache.get(f'article:updated_at:{pk}:{version}')
+        if updated_at is not None:
+            return updated_at
+    queryset = Article.objects.filter(pk=pk).order_by().values_list(
+        'updated_at', flat=True
+    )
+    updated_at = next(iter(queryset), None)
+    if updated_at is not None:
+        version = _get_version(DETAIL_VERSION_KEY.format(pk=pk))
+        cache.set(
+            f'article:updated_at:{pk}:{version}', updated_at, get_timeout()
+        )
+    return updated_at
+
+
+def invalidate_leaderboard():
+    _bump_version(LEADERBOARD_VERSION_KEY)
+
+
+def _invalidate(pk):
+    _bump_version(LIST_VERSION_KEY)
+    _bump_version(LEADERBOARD_VERSION_KEY)
+    if pk is not None:
+        _bump_version(DETAIL_VERSION_KEY.format(pk=pk))
+
+
+def invalidate_article(pk=None):
+    """
+    Drop every cached list page and the cached detail of the article.
+
+    Run once right away and once more after commit, so a reader that cached
+    the old row between the write and the commit is busted as well.
+    """
+    _invalidate(pk)
+    transaction.on_commit(lambda: _invalidate(pk))
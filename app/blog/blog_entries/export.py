@@ -0,0 +1,72 @@
+import json
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from rest_framework.negotiation import BaseContentNegotiation
+from rest_framework.renderers import BaseRenderer
+
+from .models import Article
+
+EXPORT_FIELDS = [
+    'id', 'author', 'pub_date', 'updated_at',
+    'like', 'dislike', 'title', 'entry'
+]
+
+
+class NDJSONRenderer(BaseRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data, cls=DjangoJSONEncoder) + '\n'
+
+
+class IgnoreAcceptNegotiation(BaseContentNegotiation):
+    """
+    Always pick the first renderer of the view, whatever the Accept header
+    asks for, so e.g. ``Accept: application/json`` gets NDJSON, not a 406.
+    """
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+def iter_ndjson(chunk_size=1000, buffer_size=64 * 1024):
+    """
+    Yield all articles as NDJSON, one object per line, in buffers of about
+    buffer_size characters.
+
+    Rows are read as dicts through a server-side cursor (where the database
+    has one) chunk_size at a time, so memory does not grow with the table.
+    """
+    rows = Article.objects.order_by('id').values(*EXPORT_FIELDS).iterator(
+        chunk_size=chunk_size
+    )
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    buffer = []
+    size = 0
+    for row in rows:
+        line = encoder.encode(row) + '\n'
+        buffer.append(line)
+        size += len(line)
+        if size >= buffer_size:
+            yield ''.join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def iter_gzip(chunks, level=6):
+    """Compress text chunks into a gzip stream on the fly."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
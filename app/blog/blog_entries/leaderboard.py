@@ -0,0 +1,32 @@
+from datetime import timedelta
+
+from django.utils.timezone import now
+
+from .models import Article
+
+PERIODS = {
+    'all': None,
+    'day': timedelta(days=1),
+    'week': timedelta(days=7),
+    'month': timedelta(days=30),
+    'year': timedelta(days=365),
+}
+
+LEADERBOARD_FIELDS = [
+    'id', 'author', 'title', 'pub_date', 'excerpt', 'like', 'dislike', 'score'
+]
+
+
+def top_articles(period='all', limit=10):
+    """
+    Return the limit best scored articles published within period.
+
+    The all-time board is a walk over the (-score, -id) index. A period
+    board first narrows the articles by pub_date, so only the articles of
+    the period are sorted by score.
+    """
+    queryset = Article.objects.only(*LEADERBOARD_FIELDS)
+    if PERIODS[period] is not None:
+        since = (now() - PERIODS[period]).date()
+        queryset = queryset.filter(pub_date__gte=since)
+    return queryset.order_by('-score', '-id')[:limit]
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from blog_entries.models import Article
+
+
+class Command(BaseCommand):
+    help = 'Compute excerpt, word count and reading time of existing articles.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        fields = sorted(Article.SUMMARY_FIELDS)
+        queryset = Article.objects.only('id', 'entry').order_by('id')
+        last_id = 0
+        updated = 0
+        while True:
+            batch = list(queryset.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            for article in batch:
+                article.update_summary()
+            with transaction.atomic():
+                Article.objects.bulk_update(batch, fields)
+            updated += len(batch)
+            last_id = batch[-1].id
+        self.stdout.write(f'Updated {updated} articles.')
@@ -0,0 +1,114 @@
+from datetime import date, timedelta
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+
+from blog_auth.models import DataForAuthenticateUsers, User
+from blog_entries.models import Article
+from blog_entries.views import ArticleViewSet
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed a large article dataset and print EXPLAIN plans and timings '
+        'of the article queries.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--articles', type=int, default=100000)
+        parser.add_argument('--authors', type=int, default=100)
+        parser.add_argument('--repeat', type=int, default=50)
+        parser.add_argument(
+            '--keep', action='store_true',
+            help='Keep the seeded rows instead of rolling them back.'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.seed(options['articles'], options['authors'])
+                self.benchmark(options['repeat'])
+                if not options['keep']:
+                    raise Rollback
+        except Rollback:
+            self.stdout.write('Seeded rows rolled back.')
+
+    def seed(self, number_articles, number_authors):
+        start = perf_counter()
+        auth_data = DataForAuthenticateUsers.objects.bulk_create(
+            DataForAuthenticateUsers(
+                username=f'benchmark_{number}',
+                email=f'benchmark_{number}@example.com',
+                password='!'
+            )
+            for number in range(number_authors)
+        )
+        if not all(data.pk for data in auth_data):
+            auth_data = DataForAuthenticateUsers.objects.filter(
+                username__startswith='benchmark_'
+            )
+        authors = User.objects.bulk_create(
+            User(user_authenticate_data=data) for data in auth_data
+        )
+        if not all(author.pk for author in authors):
+            authors = list(User.objects.filter(
+                user_authenticate_data__username__startswith='benchmark_'
+            ))
+        first_day = date.today() - timedelta(days=number_articles // 10)
+        Article.objects.bulk_create(
+            (
+                Article(
+                    author=authors[number % len(authors)],
+                    pub_date=first_day + timedelta(days=number // 10),
+                    title=f'Benchmark article {number}',
+                    entry=200 * 'x'
+                )
+                for number in range(number_articles)
+            ),
+            batch_size=1000
+        )
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(f'ANALYZE {Article._meta.db_table}')
+        self.stdout.write(
+            f'Seeded {number_articles} articles for {len(authors)} authors '
+            f'in {perf_counter() - start:.2f}s.'
+        )
+
+    def get_queries(self):
+        queryset = ArticleViewSet.queryset.all()
+        ordering = ('-pub_date', '-id')
+        middle = queryset.order_by(*ordering).values(
+            'id', 'pub_date', 'author_id'
+        )[queryset.count() // 2]
+        before_middle = Q(pub_date__lt=middle['pub_date'])
+        same_day = Q(pub_date=middle['pub_date'], id__lt=middle['id'])
+        return {
+            'list first page': queryset.order_by(*ordering)[:11],
+            'list deep page': queryset.filter(
+                pub_date__lte=middle['pub_date']
+            ).filter(before_middle | same_day).order_by(*ordering)[:11],
+            'retrieve': queryset.filter(pk=middle['id']),
+            'author feed': queryset.filter(
+                author_id=middle['author_id']
+            ).order_by(*ordering)[:11],
+        }
+
+    def benchmark(self, repeat):
+        explain_options = {}
+        if connection.vendor == 'postgresql':
+            explain_options['analyze'] = True
+        for name, queryset in self.get_queries().items():
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(queryset.explain(**explain_options))
+            start = perf_counter()
+            for _ in range(repeat):
+                list(queryset.all())
+            elapsed = (perf_counter() - start) / repeat
+            self.stdout.write(f'{elapsed * 1000:.3f} ms per query\n')
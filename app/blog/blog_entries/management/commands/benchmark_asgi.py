@@ -0,0 +1,153 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from time import perf_counter, sleep
+
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.urls import reverse
+
+from blog_entries.models import Article
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare the throughput of the article list under WSGI worker threads '
+        'and under ASGI, sync and async views, with slow clients simulated by '
+        'a delay while the response is sent.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=400)
+        parser.add_argument('--concurrency', type=int, default=50)
+        parser.add_argument(
+            '--workers', type=int, default=8, help='WSGI worker threads.'
+        )
+        parser.add_argument(
+            '--latency', type=float, default=100, help='Client delay in ms.'
+        )
+        parser.add_argument('--page-size', type=int, default=20)
+        parser.add_argument(
+            '--cold', action='store_true',
+            help='Give every request its own URL, so none is served from '
+                 'the article cache.'
+        )
+
+    def handle(self, *args, **options):
+        seeded = []
+        if Article.objects.count() < options['page_size']:
+            Article.objects.bulk_create(
+                Article(title=f'Benchmark article {number}', entry=200 * 'x')
+                for number in range(options['page_size'])
+            )
+            seeded = list(Article.objects.filter(
+                title__startswith='Benchmark article '
+            ).values_list('id', flat=True))
+        self.latency = options['latency'] / 1000
+        self.cold = options['cold']
+        query = f'page_size={options["page_size"]}'
+        try:
+            scenarios = [
+                ('WSGI, sync view', self.run_wsgi, reverse('article-list')),
+                ('ASGI, sync view', self.run_asgi, reverse('article-list')),
+                (
+                    'ASGI, async view', self.run_asgi,
+                    reverse('async-article-list')
+                ),
+            ]
+            for name, run, path in scenarios:
+                cache.clear()
+                start = perf_counter()
+                statuses = run(path, query, options)
+                elapsed = perf_counter() - start
+                failed = sum(status != 200 for status in statuses)
+                self.stdout.write(self.style.MIGRATE_HEADING(name))
+                self.stdout.write(
+                    f'  {len(statuses) / elapsed:.1f} requests/s, '
+                    f'{len(statuses)} requests in {elapsed:.2f}s, '
+                    f'{failed} failed'
+                )
+        finally:
+            Article.objects.filter(id__in=seeded).delete()
+
+    def get_query_string(self, query, number):
+        return f'{query}&request={number}' if self.cold else query
+
+    def run_wsgi(self, path, query, options):
+        handler = WSGIHandler()
+
+        def request(number):
+            environ = {
+                'REQUEST_METHOD': 'GET',
+                'PATH_INFO': path,
+                'QUERY_STRING': self.get_query_string(query, number),
+                'SERVER_NAME': 'localhost',
+                'SERVER_PORT': '80',
+                'HTTP_HOST': 'localhost',
+                'wsgi.url_scheme': 'http',
+                'wsgi.input': BytesIO(),
+                'wsgi.errors': BytesIO(),
+            }
+            statuses = []
+
+            def start_response(status, headers):
+                statuses.append(int(status.split()[0]))
+
+            body = handler(environ, start_response)
+            for _ in body:
+                pass
+            # The worker is held while a slow client reads the response.
+            sleep(self.latency)
+            return statuses[0]
+
+        with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            return list(executor.map(request, range(options['requests'])))
+
+    def run_asgi(self, path, query, options):
+        handler = ASGIHandler()
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': path,
+            'raw_path': path.encode('ascii'),
+            'headers': [(b'host', b'localhost')],
+            'server': ('localhost', 80),
+            'client': ('127.0.0.1', 50000),
+        }
+
+        async def request(semaphore, number):
+            statuses = []
+
+            async def receive():
+                return {
+                    'type': 'http.request', 'body': b'', 'more_body': False
+                }
+
+            async def send(message):
+                if message['type'] == 'http.response.start':
+                    statuses.append(message['status'])
+                elif not message.get('more_body'):
+                    # A slow client only holds this coroutine, not a thread.
+                    await asyncio.sleep(self.latency)
+
+            async with semaphore:
+                query_string = self.get_query_string(query, number)
+                await handler(
+                    dict(scope, query_string=query_string.encode('ascii')),
+                    receive, send
+                )
+            return statuses[0]
+
+        async def run_all():
+            semaphore = asyncio.Semaphore(options['concurrency'])
+            return await asyncio.gather(*[
+                request(semaphore, number)
+                for number in range(options['requests'])
+            ])
+
+        return asyncio.run(run_all())
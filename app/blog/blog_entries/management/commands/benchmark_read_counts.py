@@ -0,0 +1,80 @@
+from random import Random
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import F
+
+from blog_entries.models import Article
+from blog_entries.readcounts import ReadCounter
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare the read path overhead of one UPDATE per article read with '
+        'buffered read counting. Writes are rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reads', type=int, default=10000)
+        parser.add_argument('--articles', type=int, default=100)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.benchmark(options['reads'], options['articles'])
+                raise Rollback
+        except Rollback:
+            self.stdout.write('Counted reads rolled back.')
+
+    def benchmark(self, number_reads, number_articles):
+        if not Article.objects.exists():
+            Article.objects.bulk_create(
+                Article(title=f'Benchmark article {number}', entry=200 * 'x')
+                for number in range(number_articles)
+            )
+        pks = Article.objects.values_list('id', flat=True)
+        pks = list(pks[:number_articles])
+        # Hot articles are read far more often than the others.
+        weights = [1 / rank for rank in range(1, len(pks) + 1)]
+        reads = Random(0).choices(pks, weights=weights, k=number_reads)
+
+        statements = []
+
+        def count_statements(execute, sql, params, many, context):
+            statements.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_statements):
+            start = perf_counter()
+            for pk in reads:
+                Article.objects.filter(pk=pk).update(views=F('views') + 1)
+            self.report(
+                'UPDATE per read', perf_counter() - start, number_reads,
+                len(statements)
+            )
+
+            statements.clear()
+            counter = ReadCounter()
+            start = perf_counter()
+            for pk in reads:
+                counter.add(pk)
+            buffered = perf_counter() - start
+            start = perf_counter()
+            counter.flush()
+            flush = perf_counter() - start
+            self.report(
+                'buffered', buffered + flush, number_reads, len(statements)
+            )
+            self.stdout.write(f'  of which final flush: {flush * 1000:.2f} ms')
+
+    def report(self, name, elapsed, number_reads, number_statements):
+        self.stdout.write(self.style.MIGRATE_HEADING(name))
+        self.stdout.write(
+            f'  {elapsed * 1e6 / number_reads:.2f} us per read, '
+            f'{number_statements} statements for {number_reads} reads'
+        )
@@ -0,0 +1,87 @@
+from datetime import date
+from io import BytesIO
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from blog import renderers
+from blog.renderers import FastJSONParser, FastJSONRenderer
+from blog_auth.models import PersonalUsersData
+from blog_auth.serializers import AccountDetailSerializer
+from blog_entries.models import Article
+from blog_entries.serializers import ArticleSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        'Time JSON rendering and parsing of ArticleSerializer and '
+        'AccountDetailSerializer payloads with the stock and the fast classes.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=100)
+        parser.add_argument('--repeat', type=int, default=200)
+
+    def handle(self, *args, **options):
+        if renderers.orjson is None:
+            self.stdout.write(self.style.WARNING(
+                'orjson is not installed, the fast classes fall back to json.'
+            ))
+        items, repeat = options['items'], options['repeat']
+        payloads = {
+            'ArticleSerializer': ArticleSerializer(
+                [
+                    Article(
+                        author_id=number,
+                        title=f'Benchmark article {number}',
+                        entry='lorem ipsum ' * 200
+                    )
+                    for number in range(items)
+                ],
+                many=True
+            ).data,
+            'AccountDetailSerializer': AccountDetailSerializer(
+                [
+                    PersonalUsersData(
+                        first_name='Benchmark',
+                        last_name='Tester',
+                        nick=f'benchmark_{number}',
+                        country='PL',
+                        date_birth=date(1996, 1, 1)
+                    )
+                    for number in range(items)
+                ],
+                many=True
+            ).data,
+        }
+        for name, data in payloads.items():
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(f'{name}, {items} items')
+            )
+            body = JSONRenderer().render(data)
+            self.compare(
+                'render',
+                lambda renderer: renderer.render(data),
+                JSONRenderer(), FastJSONRenderer(), repeat
+            )
+            self.compare(
+                'parse',
+                lambda parser: parser.parse(BytesIO(body)),
+                JSONParser(), FastJSONParser(), repeat
+            )
+
+    def compare(self, name, run, stock, fast, repeat):
+        timings = []
+        for instance in (stock, fast):
+            start = perf_counter()
+            for _ in range(repeat):
+                run(instance)
+            timings.append((perf_counter() - start) / repeat)
+        self.stdout.write(
+            f'  {name}: {type(stock).__name__} {timings[0] * 1000:.3f} ms, '
+            f'{type(fast).__name__} {timings[1] * 1000:.3f} ms '
+            f'({timings[0] / timings[1]:.1f}x)'
+        )
@@ -0,0 +1,32 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from blog_entries.export import iter_gzip, iter_ndjson
+
+
+class Command(BaseCommand):
+    help = 'Stream all articles as NDJSON to a file or to standard output.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output', help='Output file, standard output by default.'
+        )
+        parser.add_argument(
+            '--gzip', action='store_true',
+            help='Compress the output with gzip.'
+        )
+        parser.add_argument('--chunk-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        chunks = iter_ndjson(chunk_size=options['chunk_size'])
+        if options['gzip']:
+            chunks = iter_gzip(chunks)
+        else:
+            chunks = (chunk.encode('utf-8') for chunk in chunks)
+        if options['output']:
+            with open(options['output'], 'wb') as output:
+                output.writelines(chunks)
+        else:
+            sys.stdout.buffer.writelines(chunks)
+            sys.stdout.buffer.flush()
@@ -0,0 +1,245 @@
+import csv
+import json
+import sys
+from itertools import islice
+from time import perf_counter
+
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import validate_email
+from django.db import connection, transaction
+from django.db.models import Q
+
+from blog_auth.models import DataForAuthenticateUsers, User
+from blog_entries.bulk import bulk_insert_articles
+from blog_entries.models import Article
+from blog_entries.serializers import ArticleSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        'Import users or articles from a JSONL or CSV file in validated '
+        'batches. Articles name their author by username or email.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', choices=['users', 'articles'])
+        parser.add_argument('path', help='Input file, "-" for standard input.')
+        parser.add_argument('--format', choices=['jsonl', 'csv'])
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument(
+            '--no-copy', action='store_true',
+            help='Use bulk_create even where PostgreSQL COPY is available.'
+        )
+
+    def handle(self, *args, **options):
+        input_format = options['format']
+        if input_format is None:
+            is_csv = options['path'].endswith('.csv')
+            input_format = 'csv' if is_csv else 'jsonl'
+        self.batch_size = options['batch_size']
+        self.use_copy = (
+            not options['no_copy'] and connection.vendor == 'postgresql'
+        )
+        self.authors = {}
+        if options['model'] == 'users':
+            import_batch = self.import_users
+        else:
+            import_batch = self.import_articles
+
+        start = perf_counter()
+        imported = skipped = 0
+        with self.open_input(options['path']) as stream:
+            rows = self.read_rows(stream, input_format)
+            while True:
+                batch = list(islice(rows, self.batch_size))
+                if not batch:
+                    break
+                created, errors = import_batch(batch)
+                imported += created
+                skipped += len(errors)
+                for line, error in sorted(errors, key=lambda item: item[0]):
+                    self.stderr.write(
+                        f'Line {line}: {self.format_error(error)}'
+                    )
+                if options['verbosity'] >= 2:
+                    self.stdout.write(f'{imported} rows imported...')
+        elapsed = perf_counter() - start
+        rate = imported / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {imported} {options["model"]}, skipped {skipped} '
+            f'in {elapsed:.2f}s ({rate:.0f} rows/s).'
+        ))
+
+    def format_error(self, error):
+        if isinstance(error, dict):
+            return '; '.join(
+                f'{field}: {" ".join(str(message) for message in messages)}'
+                for field, messages in error.items()
+            )
+        return str(error)
+
+    def open_input(self, path):
+        if path == '-':
+            return open(sys.stdin.fileno(), encoding='utf-8', closefd=False)
+        try:
+            return open(path, encoding='utf-8', newline='')
+        except OSError as error:
+            raise CommandError(error)
+
+    def read_rows(self, stream, input_format):
+        """Yield (line number, row dict) pairs."""
+        if input_format == 'csv':
+            reader = csv.DictReader(stream)
+            for row in reader:
+                yield reader.line_num, row
+            return
+        for line, text in enumerate(stream, start=1):
+            if not text.strip():
+                continue
+            try:
+                row = json.loads(text)
+            except ValueError as error:
+                row = error
+            yield line, row
+
+    def import_users(self, batch):
+        errors = []
+        valid = []
+        for line, row in batch:
+            error = self.validate_user(row)
+            if error:
+                errors.append((line, error))
+            else:
+                valid.append((line, row))
+
+        usernames = [row['username'] for _, row in valid]
+        emails = [row['email'] for _, row in valid]
+        taken = DataForAuthenticateUsers.objects.filter(
+            Q(username__in=usernames) | Q(email__in=emails)
+        ).values_list('username', 'email')
+        taken_usernames = {username for username, _ in taken}
+        taken_emails = {email for _, email in taken}
+
+        auth_data = []
+        for line, row in valid:
+            username, email = row['username'], row['email']
+            if username in taken_usernames or email in taken_emails:
+                errors.append((
+                    line, 'A user with that username or e-mail already exists.'
+                ))
+                continue
+            taken_usernames.add(username)
+            taken_emails.add(email)
+            auth_data.append(DataForAuthenticateUsers(
+                username=username,
+                email=email,
+                password=self.get_password(row['password'])
+            ))
+
+        with transaction.atomic():
+            auth_data = DataForAuthenticateUsers.objects.bulk_create(auth_data)
+            if not all(data.pk for data in auth_data):
+                auth_data = DataForAuthenticateUsers.objects.filter(
+                    username__in=[data.username for data in auth_data]
+                ).only('id')
+            User.objects.bulk_create(
+                User(user_authenticate_data=data) for data in auth_data
+            )
+        return len(auth_data), errors
+
+    def validate_user(self, row):
+        if not isinstance(row, dict):
+            return f'Invalid row: {row}'
+        missing = [
+            name for name in ('username', 'email', 'password')
+            if not row.get(name)
+        ]
+        if missing:
+            return f'Missing fields: {", ".join(missing)}.'
+        if not 3 <= len(row['username']) <= 150:
+            return 'Username must have between 3 and 150 characters.'
+        try:
+            validate_email(row['email'])
+        except ValidationError:
+            return 'Enter a valid email address.'
+        return None
+
+    def get_password(self, password):
+        """Keep passwords that are already hashed, hash the others."""
+        try:
+            identify_hasher(password)
+        except ValueError:
+            return make_password(password)
+        return password
+
+    def import_articles(self, batch):
+        errors = []
+        rows = []
+        for line, row in batch:
+            if isinstance(row, dict):
+                rows.append((line, row))
+            else:
+                errors.append((line, f'Invalid row: {row}'))
+        serializer = ArticleSerializer(
+            data=[row for _, row in rows], many=True
+        )
+        if not serializer.is_valid():
+            # Keep the valid rows; validating them again cannot fail.
+            valid_rows = []
+            for (line, row), error in zip(rows, serializer.errors):
+                if error:
+                    errors.append((line, error))
+                else:
+                    valid_rows.append((line, row))
+            rows = valid_rows
+            serializer = ArticleSerializer(
+                data=[row for _, row in rows], many=True
+            )
+            serializer.is_valid(raise_exception=True)
+        self.resolve_authors(row.get('author') for _, row in rows)
+
+        pub_date_field = Article._meta.get_field('pub_date')
+        articles = []
+        for (line, row), attrs in zip(rows, serializer.validated_data):
+            author = self.authors.get(row.get('author'))
+            if author is None:
+                errors.append((line, f'Unknown author: {row.get("author")}.'))
+                continue
+            article = Article(author_id=author, **attrs)
+            if row.get('pub_date'):
+                try:
+                    article.pub_date = pub_date_field.to_python(
+                        row['pub_date']
+                    )
+                except ValidationError as invalid:
+                    errors.append((line, ' '.join(invalid.messages)))
+                    continue
+            articles.append(article)
+        bulk_insert_articles(
+            articles, batch_size=self.batch_size, use_copy=self.use_copy
+        )
+        return len(articles), errors
+
+    def resolve_authors(self, references):
+        """
+        Map author usernames and emails to blog user ids with one query per
+        batch, remembering the answers for the following batches.
+        """
+        missing = {
+            reference for reference in references
+            if reference and reference not in self.authors
+        }
+        if not missing:
+            return
+        by_username = Q(user_authenticate_data__username__in=missing)
+        by_email = Q(user_authenticate_data__email__in=missing)
+        users = User.objects.filter(by_username | by_email).values_list(
+            'id',
+            'user_authenticate_data__username',
+            'user_authenticate_data__email'
+        )
+        for user_id, username, email in users:
+            self.authors[username] = user_id
+            self.authors[email] = user_id
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from blog_auth.models import PersonalUsersData
+from blog_entries.models import Article
+
+
+class Command(BaseCommand):
+    help = (
+        'Recompute PersonalUsersData.number_article from the articles table.'
+    )
+
+    def handle(self, *args, **options):
+        articles = (
+            Article.objects
+            .filter(author__user_personal_data=OuterRef('pk'))
+            .order_by()
+            .values('author__user_personal_data')
+            .annotate(number=Count('id'))
+            .values('number')
+        )
+        number = Coalesce(Subquery(articles), 0)
+        # One UPDATE counts and writes in the same statement, so articles
+        # written meanwhile can not slip in between, and only the drifted
+        # counters are locked.
+        repaired = (
+            PersonalUsersData.objects.exclude(number_article=number)
+            .update(number_article=number)
+        )
+        self.stdout.write(f'Repaired {repaired} counters.')
@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Exists, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from blog_entries.cache import invalidate_leaderboard
+from blog_entries.models import Article, Vote
+
+
+def count_votes(value):
+    """Correlated subquery counting the votes of value on the outer article."""
+    votes = (
+        Vote.objects.filter(article=OuterRef('pk'), value=value)
+        .order_by().values('article').annotate(number=Count('id'))
+        .values('number')
+    )
+    return Coalesce(Subquery(votes), 0)
+
+
+class Command(BaseCommand):
+    help = (
+        'Recompute Article.score from the like and dislike counters, or with '
+        '--from-votes recompute the counters from the votes table as well.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--from-votes', action='store_true',
+            help=(
+                'Recount like and dislike from recorded votes first. '
+                'Articles without votes keep their counters.'
+            )
+        )
+
+    def handle(self, *args, **options):
+        # Single UPDATE statements, so rows are only locked while they are
+        # written and nothing is loaded into Python.
+        with transaction.atomic():
+            recounted = 0
+            if options['from_votes']:
+                voted = Exists(Vote.objects.filter(article=OuterRef('pk')))
+                recounted = Article.objects.filter(voted).update(
+                    like=count_votes(Vote.LIKE),
+                    dislike=count_votes(Vote.DISLIKE)
+                )
+            repaired = (
+                Article.objects.exclude(score=F('like') - F('dislike'))
+                .update(score=F('like') - F('dislike'))
+            )
+        invalidate_leaderboard()
+        self.stdout.write(
+            f'Recounted votes of {recounted} articles, '
+            f'repaired {repaired} scores.'
+        )
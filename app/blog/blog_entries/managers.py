@@ -0,0 +1,63 @@
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+
+
+class VoteManager(models.Manager):
+
+    def cast(self, user, article, value):
+        """
+        Record the vote of user on article and keep Article.like,
+        Article.dislike and Article.score in step within the same transaction.
+
+        The counters are moved with F() expressions, so concurrent voters
+        never overwrite each other. Voting twice the same way changes nothing,
+        voting the other way moves one count between the counters.
+        Return the new (like, dislike) pair.
+        """
+        counters = self.model.COUNTER_FIELDS
+        changes = {}
+        with transaction.atomic():
+            vote = self._get_for_update(user, article)
+            if vote is None:
+                vote = self._insert_or_lock(user, article, value)
+                if vote is None:
+                    changes = {
+                        counters[value]: F(counters[value]) + 1,
+                        'score': F('score') + value,
+                    }
+            if vote is not None and vote.value != value:
+                changes = {
+                    counters[value]: F(counters[value]) + 1,
+                    counters[vote.value]: F(counters[vote.value]) - 1,
+                    'score': F('score') + 2 * value,
+                }
+                vote.value = value
+                vote.save(update_fields=['value'])
+            articles = article.__class__.objects.filter(pk=article.pk)
+            if changes:
+                articles.update(**changes)
+            return articles.values_list('like', 'dislike').get()
+
+    def _insert_or_lock(self, user, article, value):
+        """
+        Insert the vote and return None, or return the vote the same user
+        inserted concurrently, locked, so it is treated as a change.
+        """
+        try:
+            with transaction.atomic():
+                self.create(user=user, article=article, value=value)
+            return None
+        except IntegrityError:
+            vote = self._get_for_update(user, article)
+            if vote is not None:
+                return vote
+        # The conflicting vote was deleted meanwhile, insert once more. A
+        # second failure is not a race between votes and propagates.
+        with transaction.atomic():
+            self.create(user=user, article=article, value=value)
+        return None
+
+    def _get_for_update(self, user, article):
+        return self.select_for_update().filter(
+            user=user, article=article
+        ).first()
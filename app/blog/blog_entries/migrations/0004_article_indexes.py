@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-17 18:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_entries', '0003_delete_comment'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['-pub_date', '-id'], name='article_pub_date_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['author', '-pub_date', '-id'], name='article_author_pub_date_idx'),
+        ),
+    ]
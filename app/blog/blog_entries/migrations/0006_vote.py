@@ -0,0 +1,42 @@
+# Generated by Django 3.2.25 on 2026-10-17 18:37
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_auth', '0003_auto_20200108_0941'),
+        ('blog_entries', '0005_article_updated_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='article',
+            name='dislike',
+            field=models.PositiveIntegerField(default=0, verbose_name='you dislike it'),
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='like',
+            field=models.PositiveIntegerField(default=0, verbose_name='you like it'),
+        ),
+        migrations.CreateModel(
+            name='Vote',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.SmallIntegerField(choices=[(1, 'Like'), (-1, 'Dislike')], verbose_name='vote')),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='votes', to='blog_entries.article')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='votes', to='blog_auth.user')),
+            ],
+            options={
+                'verbose_name': 'vote',
+                'verbose_name_plural': 'votes',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='vote',
+            constraint=models.UniqueConstraint(fields=('user', 'article'), name='unique_vote_per_user_article'),
+        ),
+    ]
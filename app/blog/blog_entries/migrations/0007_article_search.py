@@ -0,0 +1,59 @@
+from django.db import migrations
+
+# The search index lives outside the Django model. PostgreSQL gets a tsvector
+# column with a GIN index, kept up to date by a trigger. SQLite, used for local
+# and test runs, gets an FTS5 table kept up to date by blog_entries.search;
+# triggers would not survive the table rebuilds SQLite migrations perform.
+
+POSTGRESQL_FORWARD = [
+    "ALTER TABLE blog_entries_article ADD COLUMN search_vector tsvector",
+    "CREATE INDEX article_search_vector_idx ON blog_entries_article USING GIN (search_vector)",
+    """
+    CREATE TRIGGER article_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, entry ON blog_entries_article
+    FOR EACH ROW EXECUTE PROCEDURE
+    tsvector_update_trigger(search_vector, 'pg_catalog.english', title, entry)
+    """,
+    """
+    UPDATE blog_entries_article
+    SET search_vector = to_tsvector('pg_catalog.english', title || ' ' || entry)
+    """,
+]
+
+POSTGRESQL_BACKWARD = [
+    "DROP TRIGGER IF EXISTS article_search_vector_update ON blog_entries_article",
+    "ALTER TABLE blog_entries_article DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE blog_entries_article_fts USING fts5(title, entry)",
+    """
+    INSERT INTO blog_entries_article_fts (rowid, title, entry)
+    SELECT id, title, entry FROM blog_entries_article
+    """,
+]
+
+SQLITE_BACKWARD = [
+    "DROP TABLE IF EXISTS blog_entries_article_fts",
+]
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_entries', '0006_vote'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor({'postgresql': POSTGRESQL_FORWARD, 'sqlite': SQLITE_FORWARD}),
+            run_for_vendor({'postgresql': POSTGRESQL_BACKWARD, 'sqlite': SQLITE_BACKWARD}),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 3.2.25 on 2026-10-17 18:46
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def compute_scores(apps, schema_editor):
+    Article = apps.get_model('blog_entries', 'Article')
+    Article.objects.update(score=F('like') - F('dislike'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_entries', '0008_article_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='score',
+            field=models.IntegerField(default=0, editable=False, help_text='Likes minus dislikes, kept in step by Vote.objects.cast.', verbose_name='score'),
+        ),
+        migrations.RunPython(compute_scores, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['-score', '-id'], name='article_score_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-17 18:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_entries', '0009_article_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='views',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='views'),
+        ),
+    ]
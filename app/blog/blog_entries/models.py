@@ -1,12 +1,17 @@
 from django.db import models
+from django.utils.text import Truncator
 from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinLengthValidator
 
 from blog_auth.models import User
+from .managers import VoteManager
 
 
 class Article(models.Model):
+    EXCERPT_LENGTH = 300
+    WORDS_PER_MINUTE = 200
+    SUMMARY_FIELDS = {'excerpt', 'word_count', 'reading_time'}
     author = models.ForeignKey(
         to=User,
         on_delete=models.CASCADE,
@@ -18,14 +23,27 @@ class Article(models.Model):
         help_text=_('Enter the publication date of the article.'),
         default=now
     )
-    like = models.SmallIntegerField(
+    like = models.PositiveIntegerField(
         verbose_name=_('you like it'),
         default=0
     )
-    dislike = models.SmallIntegerField(
+    dislike = models.PositiveIntegerField(
         verbose_name=_('you dislike it'),
         default=0
     )
+    score = models.IntegerField(
+        verbose_name=_('score'),
+        help_text=_(
+            'Likes minus dislikes, kept in step by Vote.objects.cast.'
+        ),
+        default=0,
+        editable=False
+    )
+    views = models.PositiveIntegerField(
+        verbose_name=_('views'),
+        default=0,
+        editable=False
+    )
     title = models.CharField(
         verbose_name=_('title'),
         max_length=300,
@@ -37,14 +55,111 @@ class Article(models.Model):
         help_text=_('Your blog entry'),
         validators=[MinLengthValidator(limit_value=200)]
     )
+    updated_at = models.DateTimeField(
+        verbose_name=_('updated at'),
+        auto_now=True,
+        db_index=True
+    )
+    excerpt = models.CharField(
+        verbose_name=_('excerpt'),
+        max_length=EXCERPT_LENGTH,
+        blank=True,
+        editable=False
+    )
+    word_count = models.PositiveIntegerField(
+        verbose_name=_('word count'),
+        default=0,
+        editable=False
+    )
+    reading_time = models.PositiveIntegerField(
+        verbose_name=_('reading time in minutes'),
+        default=0,
+        editable=False
+    )
 
     class Meta:
         verbose_name = _('article')
         verbose_name_plural = _('articles')
         ordering = ['-pub_date']
+        indexes = [
+            models.Index(
+                fields=['-pub_date', '-id'], name='article_pub_date_id_idx'
+            ),
+            models.Index(
+                fields=['author', '-pub_date', '-id'],
+                name='article_author_pub_date_idx'
+            ),
+            models.Index(fields=['-score', '-id'], name='article_score_idx'),
+        ]
     
     def check_the_owner(self, author):
-        return self.author.user_authenticate_data.username == author.username or author.is_superuser       
+        """
+        Compare ids only, so no extra query is issued when the article
+        was loaded together with its author.
+        """
+        if author.is_superuser:
+            return True
+        if self.author is None:
+            return False
+        return self.author.user_authenticate_data_id == author.id
+
+    def update_summary(self):
+        """
+        Compute excerpt, word_count and reading_time from entry, so list
+        cards never have to read the entry itself.
+        """
+        words = self.entry.split()
+        self.excerpt = Truncator(' '.join(words)).chars(self.EXCERPT_LENGTH)
+        self.word_count = len(words)
+        self.reading_time = -(-self.word_count // self.WORDS_PER_MINUTE)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'entry' in update_fields:
+            self.update_summary()
+            if update_fields is not None:
+                update_fields = set(update_fields) | self.SUMMARY_FIELDS
+                kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.title
+
+
+class Vote(models.Model):
+    LIKE = 1
+    DISLIKE = -1
+    VALUE_CHOICES = [
+        (LIKE, 'Like'),
+        (DISLIKE, 'Dislike')
+    ]
+    COUNTER_FIELDS = {
+        LIKE: 'like',
+        DISLIKE: 'dislike'
+    }
+    user = models.ForeignKey(
+        to=User,
+        on_delete=models.CASCADE,
+        related_name='votes'
+    )
+    article = models.ForeignKey(
+        to=Article,
+        on_delete=models.CASCADE,
+        related_name='votes'
+    )
+    value = models.SmallIntegerField(
+        verbose_name=_('vote'),
+        choices=VALUE_CHOICES
+    )
+    objects = VoteManager()
+
+    class Meta:
+        verbose_name = _('vote')
+        verbose_name_plural = _('votes')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'article'],
+                name='unique_vote_per_user_article'
+            ),
+        ]
+
@@ -0,0 +1,211 @@
+from base64 import b64decode, b64encode
+from urllib import parse
+
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .search import search_article_ids
+
+
+class SizedPagination(BasePagination):
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+
+class KeysetPagination(SizedPagination):
+    """
+    Keyset (seek) pagination over a unique ordering.
+
+    The cursor stores the ordering values of the first or last row of a page,
+    so every page is a range scan over an index that matches ``ordering``.
+    No ``COUNT(*)`` and no ``OFFSET`` is issued, whatever the page depth.
+    The last ordering field must be unique (usually the primary key).
+    """
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = _('Invalid cursor')
+    ordering = ('-pk',)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.fields = [
+            self._parse_field(queryset.model, name) for name in self.ordering
+        ]
+        position, self.reverse = self.decode_cursor(request)
+
+        if position is not None:
+            queryset = queryset.filter(
+                self._seek_filter(position, self.reverse)
+            )
+        queryset = queryset.order_by(*self._order_by(self.reverse))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        if self.reverse:
+            self.page.reverse()
+
+        if self.reverse:
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self._position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self._position(self.page[0]), reverse=True)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+        try:
+            querystring = b64decode(encoded.encode('ascii')).decode('ascii')
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            reverse = bool(int(tokens.get('r', ['0'])[0]))
+            values = tokens['p']
+            if len(values) != len(self.fields):
+                raise ValueError
+            position = [
+                field.to_python(value)
+                for (field, _descending), value in zip(self.fields, values)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, position, reverse):
+        tokens = [('p', value) for value in position]
+        if reverse:
+            tokens.append(('r', '1'))
+        querystring = parse.urlencode(tokens)
+        encoded = b64encode(querystring.encode('ascii')).decode('ascii')
+        url = remove_query_param(self.base_url, self.cursor_query_param)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def _parse_field(self, model, name):
+        descending = name.startswith('-')
+        name = name.lstrip('-')
+        field = model._meta.pk if name == 'pk' else model._meta.get_field(name)
+        return field, descending
+
+    def _position(self, instance):
+        return [
+            field.value_to_string(instance)
+            for field, _descending in self.fields
+        ]
+
+    def _order_by(self, reverse):
+        return [
+            ('-' if descending != reverse else '') + field.attname
+            for field, descending in self.fields
+        ]
+
+    def _seek_filter(self, position, reverse):
+        """
+        Build the lexicographic "row comes after position" condition, i.e.
+        (a > x) OR (a = x AND b > y) with the comparison flipped per field
+        according to its direction. The redundant non-strict bound on the
+        leading field lets the database seek into the index instead of
+        scanning it.
+        """
+        condition = Q()
+        equal = Q()
+        for (field, descending), value in zip(self.fields, position):
+            lookup = 'lt' if descending != reverse else 'gt'
+            condition |= equal & Q(**{f'{field.attname}__{lookup}': value})
+            equal &= Q(**{field.attname: value})
+        (field, descending), value = self.fields[0], position[0]
+        lookup = 'lte' if descending != reverse else 'gte'
+        return Q(**{f'{field.attname}__{lookup}': value}) & condition
+
+
+class ArticlePagination(KeysetPagination):
+    ordering = ('-pub_date', '-id')
+
+
+class SearchPagination(SizedPagination):
+    """
+    Page through ranked full-text search results given by ``?q=``.
+
+    Ranked results have no stable keyset, so pages are numbered. One extra id
+    is fetched to know whether a next page exists, no ``COUNT(*)`` is run.
+    The author of an author feed, the view's ``author_id``, is searched in.
+    """
+    search_query_param = 'q'
+    page_query_param = 'page'
+    invalid_page_message = _('Invalid page.')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        try:
+            self.page_number = int(
+                request.query_params.get(self.page_query_param, 1)
+            )
+            if self.page_number < 1:
+                raise ValueError
+        except ValueError:
+            raise NotFound(self.invalid_page_message)
+
+        if queryset.query.is_empty():
+            ids = []
+        else:
+            # The author feed filter has to apply before ranking and slicing.
+            ids = search_article_ids(
+                request.query_params.get(self.search_query_param, ''),
+                limit=self.page_size + 1,
+                offset=(self.page_number - 1) * self.page_size,
+                author_id=getattr(view, 'author_id', None)
+            )
+        self.has_next = len(ids) > self.page_size
+        ids = ids[:self.page_size]
+        rows = queryset.in_bulk(ids)
+        return [rows[pk] for pk in ids if pk in rows]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return replace_query_param(
+            self.base_url, self.page_query_param, self.page_number + 1
+        )
+
+    def get_previous_link(self):
+        if self.page_number == 1:
+            return None
+        if self.page_number == 2:
+            return remove_query_param(self.base_url, self.page_query_param)
+        return replace_query_param(
+            self.base_url, self.page_query_param, self.page_number - 1
+        )
@@ -0,0 +1,102 @@
+import atexit
+from collections import Counter
+from threading import Lock
+from time import monotonic
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models import Case, F, When
+
+from .models import Article
+
+UPDATE_BATCH_SIZE = 200
+
+
+def get_flush_interval():
+    return getattr(settings, 'ARTICLE_VIEWS_FLUSH_INTERVAL', 10)
+
+
+def get_flush_size():
+    return getattr(settings, 'ARTICLE_VIEWS_FLUSH_SIZE', 1000)
+
+
+def write_read_counts(counts):
+    """
+    Add counts, a mapping of article id to number of reads, to Article.views.
+    Each batch of articles is one UPDATE ... SET views = views + n statement.
+    Nothing is written unless every batch is.
+    """
+    items = list(counts.items())
+    with transaction.atomic():
+        for start in range(0, len(items), UPDATE_BATCH_SIZE):
+            batch = items[start:start + UPDATE_BATCH_SIZE]
+            Article.objects.filter(pk__in=[pk for pk, _ in batch]).update(
+                views=Case(
+                    *[
+                        When(pk=pk, then=F('views') + number)
+                        for pk, number in batch
+                    ],
+                    default=F('views')
+                )
+            )
+
+
+class ReadCounter:
+    """
+    Count article reads in process and write them in batches.
+
+    A read only bumps a counter under a lock. Pending reads are written once
+    the flush interval has passed since the last write or once flush size
+    reads piled up, so a crashed process loses at most that many reads.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.pending = Counter()
+        self.pending_total = 0
+        self.last_flush = monotonic()
+
+    def add(self, pk):
+        with self.lock:
+            self.pending[pk] += 1
+            self.pending_total += 1
+            full = self.pending_total >= get_flush_size()
+            due = full or monotonic() - self.last_flush >= get_flush_interval()
+        if due:
+            try:
+                self.flush()
+            except DatabaseError:
+                # The reads are pending again, the next flush retries them.
+                pass
+
+    def flush(self):
+        """Write the pending reads and return how many were written."""
+        with self.lock:
+            pending, self.pending = self.pending, Counter()
+            self.pending_total = 0
+            self.last_flush = monotonic()
+        if not pending:
+            return 0
+        try:
+            write_read_counts(pending)
+        except DatabaseError:
+            with self.lock:
+                self.pending.update(pending)
+                self.pending_total += sum(pending.values())
+            raise
+        return sum(pending.values())
+
+
+read_counter = ReadCounter()
+
+
+@atexit.register
+def _flush_at_exit():
+    try:
+        read_counter.flush()
+    except Exception:  # pylint: disable=broad-except
+        pass
+
+
+def count_read(pk):
+    read_counter.add(pk)
@@ -0,0 +1,117 @@
+from django.db import connection
+from django.db.models import Q
+
+from .models import Article
+
+FTS_TABLE = 'blog_entries_article_fts'
+
+POSTGRESQL_SEARCH = """
+    SELECT id
+    FROM blog_entries_article,
+        plainto_tsquery('pg_catalog.english', %s) AS query
+    WHERE search_vector @@ query{author}
+    ORDER BY ts_rank(search_vector, query) DESC, id DESC
+    LIMIT %s OFFSET %s
+"""
+
+SQLITE_SEARCH = f"""
+    SELECT {FTS_TABLE}.rowid FROM {FTS_TABLE}{{join}}
+    WHERE {FTS_TABLE} MATCH %s{{author}}
+    ORDER BY {FTS_TABLE}.rank, {FTS_TABLE}.rowid DESC
+    LIMIT %s OFFSET %s
+"""
+
+SQLITE_AUTHOR_JOIN = (
+    f' INNER JOIN blog_entries_article'
+    f' ON blog_entries_article.id = {FTS_TABLE}.rowid'
+)
+
+AUTHOR_CONDITION = ' AND blog_entries_article.author_id = %s'
+
+FTS_DELETE = f'DELETE FROM {FTS_TABLE} WHERE rowid = %s'
+
+FTS_INSERT = (
+    f'INSERT INTO {FTS_TABLE} (rowid, title, entry) VALUES (%s, %s, %s)'
+)
+
+
+def _fts5_query(text):
+    """Quote every word, so user input is never parsed as FTS5 syntax."""
+    words = ['"%s"' % word.replace('"', '""') for word in text.split()]
+    return ' '.join(words)
+
+
+def search_article_ids(text, limit, offset=0, author_id=None):
+    """
+    Return the ids of the articles matching text, best ranked first, of the
+    author with author_id only when it is given. The author is filtered
+    before ranking and slicing, so pages of one author are always full.
+
+    PostgreSQL ranks over the GIN indexed tsvector column, SQLite over the
+    FTS5 table. Other databases fall back to a substring scan.
+    """
+    if not text.split():
+        return []
+    author_params = [] if author_id is None else [author_id]
+    author = '' if author_id is None else AUTHOR_CONDITION
+    if connection.vendor == 'postgresql':
+        return _fetch_ids(
+            POSTGRESQL_SEARCH.format(author=author),
+            [text, *author_params, limit, offset]
+        )
+    if connection.vendor == 'sqlite':
+        join = '' if author_id is None else SQLITE_AUTHOR_JOIN
+        return _fetch_ids(
+            SQLITE_SEARCH.format(join=join, author=author),
+            [_fts5_query(text), *author_params, limit, offset]
+        )
+    queryset = Article.objects.filter(
+        Q(title__icontains=text) | Q(entry__icontains=text)
+    )
+    if author_id is not None:
+        queryset = queryset.filter(author_id=author_id)
+    ids = queryset.order_by('-pub_date', '-id').values_list('id', flat=True)
+    return list(ids[offset:offset + limit])
+
+
+def _fetch_ids(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def index_articles(articles, created=False):
+    """
+    Write articles into the SQLite FTS5 table. PostgreSQL maintains its
+    tsvector column with a trigger, so there is nothing to do there.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    rows = [(article.pk, article.title, article.entry) for article in articles]
+    with connection.cursor() as cursor:
+        if not created:
+            cursor.executemany(FTS_DELETE, [row[:1] for row in rows])
+        cursor.executemany(FTS_INSERT, rows)
+
+
+def index_new_articles():
+    """
+    Index rows written without primary keys coming back, e.g. by bulk_create
+    on SQLite. Article ids only grow, so the new rows are those above the
+    highest indexed id.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"""
+            INSERT INTO {FTS_TABLE} (rowid, title, entry)
+            SELECT id, title, entry FROM blog_entries_article
+            WHERE id > (SELECT COALESCE(MAX(rowid), 0) FROM {FTS_TABLE})
+        """)
+
+
+def unindex_articles(pks):
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(FTS_DELETE, [(pk,) for pk in pks])
@@ -1,8 +1,52 @@
 from rest_framework import serializers
 
+from .bulk import bulk_insert_articles
 from .models import Article
 
-class ArticleSerializer(serializers.ModelSerializer):
+
+class ArticleListSerializer(serializers.ListSerializer):
+
+    def create(self, validated_data):
+        return bulk_insert_articles(
+            [Article(**attrs) for attrs in validated_data]
+        )
+
+
+class SparseFieldsMixin:
+    """
+    Accept a ``fields`` argument naming the only fields to keep in the
+    serializer output.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class ArticleSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Article
         fields = ['author', 'title', 'entry']
+        read_only_fields = ['author']
+        list_serializer_class = ArticleListSerializer
+
+
+class ArticleCardSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = Article
+        fields = [
+            'id', 'author', 'title', 'pub_date',
+            'excerpt', 'word_count', 'reading_time'
+        ]
+
+
+class ArticleScoreSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Article
+        fields = [
+            'id', 'author', 'title', 'pub_date',
+            'excerpt', 'like', 'dislike', 'score'
+        ]
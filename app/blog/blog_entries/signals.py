@@ -0,0 +1,35 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from blog_auth.models import PersonalUsersData
+from .cache import invalidate_article
+from .models import Article
+from .search import index_articles, unindex_articles
+
+
+@receiver([post_save, post_delete], sender=Article)
+def invalidate_article_cache(sender, instance, **kwargs):
+    invalidate_article(instance.pk)
+
+
+@receiver(post_save, sender=Article)
+def index_article(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is None or {'title', 'entry'} & set(update_fields):
+        index_articles([instance], created=created)
+
+
+@receiver(post_delete, sender=Article)
+def unindex_article(sender, instance, **kwargs):
+    unindex_articles([instance.pk])
+
+
+@receiver(post_save, sender=Article)
+def count_created_article(sender, instance, created, **kwargs):
+    if created and instance.author_id is not None:
+        PersonalUsersData.objects.change_number_article(instance.author_id, 1)
+
+
+@receiver(post_delete, sender=Article)
+def count_deleted_article(sender, instance, **kwargs):
+    if instance.author_id is not None:
+        PersonalUsersData.objects.change_number_article(instance.author_id, -1)
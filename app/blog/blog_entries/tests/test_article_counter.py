@@ -0,0 +1,113 @@
+from datetime import date
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+
+from rest_framework.test import APITestCase
+from rest_framework.reverse import reverse
+from rest_framework.authtoken.models import Token
+
+from blog_auth.models import DataForAuthenticateUsers, PersonalUsersData, User
+from blog_entries.models import Article
+
+
+class TestArticleCounter(APITestCase):
+    def setUp(self):
+        cache.clear()
+        data_for_auth = DataForAuthenticateUsers(
+            username="tester1996",
+            email="tester@example.com"
+        )
+        data_for_auth.set_password("Tester1996.,")
+        data_for_auth.save()
+        self.profile = PersonalUsersData.objects.create(
+            first_name="Przemyslaw",
+            last_name="Rozycki",
+            nick="TeKa",
+            date_birth=date(1996, 10, 12)
+        )
+        self.user = User(
+            user_authenticate_data=data_for_auth,
+            user_personal_data=self.profile
+        )
+        self.user.save()
+        self.token, _ = Token.objects.get_or_create(user=data_for_auth)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.data = {"title": "Counted article title", "entry": 200 * "x"}
+
+    def number_article(self):
+        self.profile.refresh_from_db()
+        return self.profile.number_article
+
+    def test_create_increments_counter(self):
+        self.client.post(path=reverse("article-list"), data=self.data)
+        self.client.post(path=reverse("article-list"), data=self.data)
+        self.assertEqual(self.number_article(), 2)
+
+    def test_bulk_create_increments_counter(self):
+        self.client.post(
+            path=reverse("article-list"), data=3 * [self.data], format="json"
+        )
+        self.assertEqual(self.number_article(), 3)
+
+    def test_destroy_decrements_counter(self):
+        self.client.post(path=reverse("article-list"), data=self.data)
+        article = Article.objects.get()
+        response = self.client.delete(
+            reverse("article-detail", args=[article.id])
+        )
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.number_article(), 0)
+
+    def test_counter_is_exposed_in_account_detail(self):
+        self.client.post(path=reverse("article-list"), data=self.data)
+        response = self.client.get(reverse("account_user-list"))
+        self.assertEqual(response.json()["number_article"], 1)
+
+    def test_profile_created_after_articles_starts_with_their_number(self):
+        self.user.user_personal_data = None
+        self.user.save()
+        self.client.post(
+            path=reverse("article-list"), data=2 * [self.data], format="json"
+        )
+        response = self.client.post(
+            path=reverse("account_user-list"),
+            data={
+                "birth_day": 12,
+                "birth_month": 10,
+                "birth_year": 1996,
+                "first_name": "Przemyslaw",
+                "last_name": "Rozycki",
+                "nick": "NewNick",
+                "country": "PL",
+                "sex": "M",
+            }
+        )
+        self.assertEqual(response.status_code, 201)
+        profile = PersonalUsersData.objects.get(nick="NewNick")
+        self.assertEqual(profile.number_article, 2)
+
+    def test_recount_articles_command(self):
+        Article.objects.bulk_create(
+            Article(
+                author=self.user,
+                title=self.data["title"],
+                entry=self.data["entry"]
+            )
+            for _ in range(4)
+        )
+        PersonalUsersData.objects.filter(pk=self.profile.pk).update(
+            number_article=99
+        )
+        out = StringIO()
+        call_command("recount_articles", stdout=out)
+        self.assertEqual(self.number_article(), 4)
+        self.assertIn("Repaired 1 counters", out.getvalue())
+
+    def test_recount_articles_without_articles(self):
+        PersonalUsersData.objects.filter(pk=self.profile.pk).update(
+            number_article=5
+        )
+        call_command("recount_articles", stdout=StringIO())
+        self.assertEqual(self.number_article(), 0)
@@ -0,0 +1,792 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APITestCase
+from rest_framework.reverse import reverse
+from rest_framework.authtoken.models import Token
+
+from blog_auth.models import DataForAuthenticateUsers, PersonalUsersData, User
+from blog_entries.models import Article
+from blog_entries.readcounts import read_counter
+
+
+class TestArticlePagination(APITestCase):
+    def setUp(self):
+        cache.clear()
+        read_counter.flush()
+        data_for_auth = DataForAuthenticateUsers(
+            username="tester1996",
+            email="tester@example.com"
+        )
+        data_for_auth.set_password("Tester1996.,")
+        data_for_auth.save()
+        self.user = User(
+            user_authenticate_data=data_for_auth
+        )
+        self.user.save()
+        self.token, _ = Token.objects.get_or_create(user=data_for_auth)
+        # Three articles share every publish date, so the id tiebreaker
+        # matters.
+        self.articles = [
+            Article.objects.create(
+                author=self.user,
+                title=f"Article number {number}",
+                entry=200 * "x",
+                pub_date=date(2020, 1, 1) + timedelta(days=number // 3)
+            )
+            for number in range(25)
+        ]
+        self.expected_titles = [
+            article.title
+            for article in sorted(
+                self.articles,
+                key=lambda article: (article.pub_date, article.id),
+                reverse=True
+            )
+        ]
+
+    def walk_forward(self, url):
+        titles = []
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.json())
+            titles.extend(item['title'] for item in response.json()['results'])
+            url = response.json()['next']
+        return titles, pages
+
+    def test_first_page(self):
+        response = self.client.get(
+            path=reverse("article-list"),
+            data={"page_size": 10}
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(
+            [item['title'] for item in data['results']],
+            self.expected_titles[:10]
+        )
+        self.assertIsNotNone(data['next'])
+        self.assertIsNone(data['previous'])
+        self.assertNotIn('count', data)
+
+    def test_walk_all_pages_forward(self):
+        titles, pages = self.walk_forward(
+            reverse("article-list") + "?page_size=4"
+        )
+        self.assertEqual(titles, self.expected_titles)
+        self.assertEqual(len(pages), 7)
+        self.assertIsNone(pages[-1]['next'])
+
+    def test_walk_all_pages_backward(self):
+        _, pages = self.walk_forward(reverse("article-list") + "?page_size=4")
+        titles = []
+        url = pages[-1]['previous']
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            page = [item['title'] for item in response.json()['results']]
+            titles = page + titles
+            url = response.json()['previous']
+        self.assertEqual(titles, self.expected_titles[:24])
+
+    def test_deep_page_does_not_count_or_offset(self):
+        _, pages = self.walk_forward(reverse("article-list") + "?page_size=4")
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(pages[-2]['next'])
+        self.assertEqual(response.status_code, 200)
+        for query in context.captured_queries:
+            self.assertNotIn('COUNT(', query['sql'].upper())
+            self.assertNotIn('OFFSET', query['sql'].upper())
+
+    def test_with_invalid_cursor(self):
+        response = self.client.get(
+            path=reverse("article-list"),
+            data={"cursor": "not-a-cursor"}
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()['detail'], 'Invalid cursor')
+
+    def test_page_size_above_table_size(self):
+        response = self.client.get(
+            path=reverse("article-list"),
+            data={"page_size": 1000}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results']), 25)
+
+
+class TestArticleQueryBudget(APITestCase):
+    def setUp(self):
+        cache.clear()
+        read_counter.flush()
+        self.owner_auth = DataForAuthenticateUsers(
+            username="tester1996",
+            email="tester@example.com"
+        )
+        self.owner_auth.set_password("Tester1996.,")
+        self.owner_auth.save()
+        self.owner = User(user_authenticate_data=self.owner_auth)
+        self.owner.save()
+        other_auth = DataForAuthenticateUsers(
+            username="other1996",
+            email="other@example.com"
+        )
+        other_auth.set_password("Tester1996.,")
+        other_auth.save()
+        User(user_authenticate_data=other_auth).save()
+        self.owner_token, _ = Token.objects.get_or_create(user=self.owner_auth)
+        self.other_token, _ = Token.objects.get_or_create(user=other_auth)
+        self.article_data = {
+            "title": "Changed title",
+            "entry": 200 * "y"
+        }
+
+    def create_articles(self, number):
+        Article.objects.bulk_create(
+            Article(
+                author=self.owner,
+                title=f"Article number {index}",
+                entry=200 * "x"
+            )
+            for index in range(number)
+        )
+
+    def count_list_queries(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                path=reverse("article-list"),
+                data={"page_size": 100}
+            )
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_list_queries_do_not_scale_with_rows(self):
+        self.create_articles(2)
+        few = self.count_list_queries()
+        self.create_articles(30)
+        many = self.count_list_queries()
+        self.assertEqual(few, many)
+        self.assertEqual(many, 1)
+
+    def test_retrieve_queries(self):
+        self.create_articles(1)
+        article = Article.objects.get()
+        cache.clear()
+        # updated_at of the article for the ETag and Last-Modified check,
+        # then the article with its author.
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                path=reverse("article-detail", args=[article.id])
+            )
+        self.assertEqual(response.status_code, 200)
+
+    def test_owner_check_does_not_lazy_load_author(self):
+        self.create_articles(1)
+        article = Article.objects.get()
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.owner_token.key
+        )
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.put(
+                path=reverse("article-detail", args=[article.id]),
+                data=self.article_data
+            )
+        self.assertEqual(response.status_code, 200)
+        # Blog user with its auth user by token, the article joined with its
+        # author and the update. On SQLite the search signal also rewrites
+        # the FTS5 row, which PostgreSQL does in a trigger.
+        self.assertEqual(
+            len(context.captured_queries),
+            5 if connection.vendor == 'sqlite' else 3
+        )
+        selects = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('SELECT')
+        ]
+        self.assertEqual(len(selects), 2)
+        self.assertIn('INNER JOIN "authtoken_token"', selects[0])
+        self.assertIn('FROM "blog_entries_article"', selects[1])
+
+    def test_update_by_other_user_is_forbidden(self):
+        self.create_articles(1)
+        article = Article.objects.get()
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.other_token.key
+        )
+        response = self.client.put(
+            path=reverse("article-detail", args=[article.id]),
+            data=self.article_data
+        )
+        self.assertEqual(response.status_code, 403)
+
+
+class TestArticleCache(APITestCase):
+    def setUp(self):
+        cache.clear()
+        read_counter.flush()
+        data_for_auth = DataForAuthenticateUsers(
+            username="tester1996",
+            email="tester@example.com"
+        )
+        data_for_auth.set_password("Tester1996.,")
+        data_for_auth.save()
+        self.user = User(user_authenticate_data=data_for_auth)
+        self.user.save()
+        self.token, _ = Token.objects.get_or_create(user=data_for_auth)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.article = Article.objects.create(
+            author=self.user,
+            title="Cached article",
+            entry=200 * "x"
+        )
+        self.article_data = {
+            "title": "Another article",
+            "entry": 200 * "y"
+        }
+
+    def test_list_is_served_from_cache(self):
+        self.client.credentials()
+        first = self.client.get(reverse("article-list"))
+        with self.assertNumQueries(0):
+            second = self.client.get(reverse("article-list"))
+        self.assertEqual(first.json(), second.json())
+
+    def test_retrieve_is_served_from_cache(self):
+        path = reverse("article-detail", args=[self.article.id])
+        self.client.credentials()
+        first = self.client.get(path)
+        with self.assertNumQueries(0):
+            second = self.client.get(path)
+        self.assertEqual(first.json(), second.json())
+
+    def test_missing_article_leaves_no_version_key(self):
+        self.client.credentials()
+        for pk in ['999999', 'junk']:
+            with self.subTest(pk=pk):
+                response = self.client.get(
+                    reverse("article-detail", args=[pk])
+                )
+                self.assertEqual(response.status_code, 404)
+                self.assertIsNone(cache.get(f'article:detail:version:{pk}'))
+
+    def test_create_invalidates_list(self):
+        self.client.get(reverse("article-list"))
+        response = self.client.post(
+            path=reverse("article-list"),
+            data=self.article_data
+        )
+        self.assertEqual(response.status_code, 201)
+        response = self.client.get(reverse("article-list"))
+        self.assertEqual(len(response.json()['results']), 2)
+
+    def test_update_invalidates_list_and_detail(self):
+        path = reverse("article-detail", args=[self.article.id])
+        self.client.get(reverse("article-list"))
+        self.client.get(path)
+        response = self.client.put(path=path, data=self.article_data)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.client.get(path).json()['title'], "Another article"
+        )
+        self.assertEqual(
+            self.client.get(reverse("article-list"))
+            .json()['results'][0]['title'],
+            "Another article"
+        )
+
+    def test_destroy_invalidates_list_and_detail(self):
+        path = reverse("article-detail", args=[self.article.id])
+        self.client.get(reverse("article-list"))
+        self.client.get(path)
+        response = self.client.delete(path)
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.client.get(path).status_code, 404)
+        self.assertEqual(
+            self.client.get(reverse("article-list")).json()['results'], []
+        )
+
+
+class TestArticleConditionalGet(APITestCase):
+    def setUp(self):
+        cache.clear()
+        read_counter.flush()
+        data_for_auth = DataForAuthenticateUsers(
+            username="tester1996",
+            email="tester@example.com"
+        )
+        data_for_auth.set_password("Tester1996.,")
+        data_for_auth.save()
+        self.user = User(user_authenticate_data=data_for_auth)
+        self.user.save()
+        self.token, _ = Token.objects.get_or_create(user=data_for_auth)
+        self.article = Article.objects.create(
+            author=self.user,
+            title="Conditional article",
+            entry=200 * "x"
+        )
+        self.detail_path = reverse("article-detail", args=[self.article.id])
+
+    def test_retrieve_sends_validators(self):
+        response = self.client.get(self.detail_path)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+    def test_retrieve_with_matching_etag(self):
+        etag = self.client.get(self.detail_path)['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                self.detail_path, HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_retrieve_with_if_modified_since(self):
+        last_modified = self.client.get(self.detail_path)['Last-Modified']
+        response = self.client.get(
+            self.detail_path, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_retrieve_after_update(self):
+        etag = self.client.get(self.detail_path)['ETag']
+        self.article.title = "Changed conditional article"
+        self.article.save()
+        response = self.client.get(self.detail_path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_list_with_matching_etag(self):
+        etag = self.client.get(reverse("article-list"))['ETag']
+        response = self.client.get(
+            reverse("article-list"), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_after_delete(self):
+        etag = self.client.get(reverse("article-list"))['ETag']
+        self.article.delete()
+        response = self.client.get(
+            reverse("article-list"), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'], [])
+
+    def test_retrieve_missing_article(self):
+        response = self.client.get(
+            reverse("article-detail", args=[self.article.id + 1])
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('ETag', response)
+
+
+class TestArticleBulkCreate(APITestCase):
+    def setUp(self):
+        cache.clear()
+        read_counter.flush()
+        data_for_auth = DataForAuthenticateUsers(
+            username="tester1996",
+            email="tester@example.com"
+        )
+        data_for_auth.set_password("Tester1996.,")
+        data_for_auth.save()
+        self.user = User(user_authenticate_data=data_for_auth)
+        self.user.save()
+        self.token, _ = Token.objects.get_or_create(user=data_for_auth)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.data = [
+            {"title": f"Imported article {number}", "entry": 200 * "x"}
+            for number in range(5)
+        ]
+
+    def test_bulk_create(self):
+        response = self.client.post(
+            path=reverse("article-list"),
+            data=self.data,
+            format="json"
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.json()), 5)
+        self.assertEqual(Article.objects.filter(author=self.user).count(), 5)
+
+    def test_bulk_create_uses_one_insert(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                path=reverse("article-list"),
+                data=self.data,
+                format="json"
+            )
+        self.assertEqual(response.status_code, 201)
+        inserts = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('INSERT INTO "blog_entries_article"')
+        ]
+        self.assertEqual(len(inserts), 1)
+
+    def test_bulk_create_with_invalid_item(self):
+        self.data[2]["title"] = "short"
+        del self.data[4]["entry"]
+        response = self.client.post(
+            path=reverse("article-list"),
+            data=self.data,
+            format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()
+        self.assertEqual(len(errors), 5)
+        self.assertEqual(errors[0], {})
+        self.assertIn("title", errors[2])
+        self.assertEqual(errors[4]["entry"][0], "This field is required.")
+        self.assertFalse(Article.objects.exists())
+
+    def test_bulk_create_over_limit(self):
+        response = self.client.post(
+            path=reverse("article-list"),
+            data=501 * self.data[:1],
+            format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Article.objects.exists())
+
+    def test_bulk_create_invalidates_list(self):
+        self.client.get(reverse("article-list"))
+        self.client.post(
+            path=reverse("article-list"),
+            data=self.data,
+            format="json"
+        )
+        response = self.client.get(reverse("article-list"))
+        self.assertEqual(len(response.json()['results']), 5)
+
+    def test_bulk_created_articles_are_searchable(self):
+        self.client.post(
+            path=reverse("article-list"),
+            data=self.data,
+            format="json"
+        )
+        response = self.client.get(
+            reverse("article-list"), data={"q": "imported"}
+        )
+        self.assertEqual(len(response.json()['results']), 5)
+
+
+class TestArticleCreate(APITestCase):
+    def setUp(self):
+        cache.clear()
+        read_counter.flush()
+        data_for_auth = DataForAuthenticateUsers(
+            username="tester1996",
+            email="tester@example.com"
+        )
+        data_for_auth.set_password("Tester1996.,")
+        data_for_auth.save()
+        self.user = User(user_authenticate_data=data_for_auth)
+        self.user.save()
+        self.token, _ = Token.objects.get_or_create(user=data_for_auth)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.data = {"title": "Freshly written article", "entry": 200 * "x"}
+
+    def post_article(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                path=reverse("article-list"),
+                data=self.data
+            )
+        queries = [
+            query['sql'] for query in context.captured_queries
+            if not any(
+                skipped in query['sql']
+                for skipped in ('blog_entries_article_fts', 'SAVEPOINT')
+            )
+        ]
+        return response, queries
+
+    def test_create(self):
+        response, _ = self.post_article()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            response.json(),
+            {
+                "author": self.user.id,
+                "title": self.data["title"],
+                "entry": self.data["entry"]
+            }
+        )
+        self.assertEqual(Article.objects.get().author, self.user)
+
+    def test_create_query_count(self):
+        response, queries = self.post_article()
+        self.assertEqual(response.status_code, 201)
+        # Blog user with its auth user by token, the article insert and the
+        # article counter of the author profile.
+        self.assertEqual(len(queries), 3)
+        self.assertTrue(
+            queries[1].startswith('INSERT INTO "blog_entries_article"')
+        )
+        self.assertIn(str(self.user.id), queries[1])
+        self.assertTrue(
+            queries[2].startswith('UPDATE "blog_auth_personalusersdata"')
+        )
+
+    def test_author_can_not_be_chosen(self):
+        other_auth = DataForAuthenticateUsers.objects.create(
+            username="other1996",
+            email="other@example.com"
+        )
+        other = User.objects.create(user_authenticate_data=other_auth)
+        self.data["author"] = other.id
+        response, _ = self.post_article()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Article.objects.get().author, self.user)
+
+
+class TestArticleSparseFields(APITestCase):
+    def setUp(self):
+        cache.clear()
+        read_counter.flush()
+        data_for_auth = DataForAuthenticateUsers(
+            username="tester1996",
+            email="tester@example.com"
+        )
+        data_for_auth.set_password("Tester1996.,")
+        data_for_auth.save()
+        self.user = User(user_authenticate_data=data_for_auth)
+        self.user.save()
+        Article.objects.bulk_create(
+            Article(
+                author=self.user,
+                title=f"Sparse article {number}",
+                entry=200 * "x"
+            )
+            for number in range(3)
+        )
+
+    def get_list(self, **params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                path=reverse("article-list"), data=params
+            )
+        return response, [query['sql'] for query in context.captured_queries]
+
+    def test_list_with_fields(self):
+        response, queries = self.get_list(fields="title")
+        self.assertEqual(response.status_code, 200)
+        for item in response.json()['results']:
+            self.assertEqual(list(item), ["title"])
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"entry"', queries[0])
+        self.assertNotIn('JOIN', queries[0])
+
+    def test_list_with_several_fields(self):
+        response, _ = self.get_list(fields="author,entry")
+        for item in response.json()['results']:
+            self.assertEqual(
+                item, {"author": self.user.id, "entry": 200 * "x"}
+            )
+
+    def test_list_with_fields_keeps_pagination(self):
+        response, _ = self.get_list(fields="title", page_size=2)
+        next_page = self.client.get(response.json()['next'])
+        self.assertEqual(len(next_page.json()['results']), 1)
+
+    def test_retrieve_with_fields(self):
+        article = Article.objects.first()
+        response = self.client.get(
+            path=reverse("article-detail", args=[article.id]),
+            data={"fields": "title"}
+        )
+        self.assertEqual(response.json(), {"title": article.title})
+
+    def test_list_with_unknown_field(self):
+        response, _ = self.get_list(fields="title,password")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()['fields'], "Unknown fields: password."
+        )
+
+    def test_list_without_fields_reads_entry(self):
+        response, queries = self.get_list()
+        self.assertIn('"entry"', queries[0])
+        self.assertEqual(len(response.json()['results'][0]), 3)
+
+
+class TestArticleCards(APITestCase):
+    def setUp(self):
+        cache.clear()
+        read_counter.flush()
+        data_for_auth = DataForAuthenticateUsers(
+            username="tester1996",
+            email="tester@example.com"
+        )
+        data_for_auth.set_password("Tester1996.,")
+        data_for_auth.save()
+        self.user = User(user_authenticate_data=data_for_auth)
+        self.user.save()
+        self.article = Article.objects.create(
+            author=self.user,
+            title="Article with a summary",
+            entry=" ".join(450 * ["word"])
+        )
+        self.article.refresh_from_db()
+
+    def test_summary_is_computed_on_save(self):
+        self.assertEqual(self.article.word_count, 450)
+        self.assertEqual(self.article.reading_time, 3)
+        self.assertEqual(len(self.article.excerpt), Article.EXCERPT_LENGTH)
+        self.assertTrue(self.article.excerpt.endswith("…"))
+
+    def test_summary_follows_entry_update(self):
+        self.article.entry = "short " * 40
+        self.article.save(update_fields=["entry"])
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.word_count, 40)
+        self.assertEqual(self.article.reading_time, 1)
+        self.assertEqual(self.article.excerpt, ("short " * 40).strip())
+
+    def test_cards_do_not_read_entry(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("article-cards"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()['results'],
+            [{
+                "id": self.article.id,
+                "author": self.user.id,
+                "title": self.article.title,
+                "pub_date": str(self.article.pub_date),
+                "excerpt": self.article.excerpt,
+                "word_count": 450,
+                "reading_time": 3,
+            }]
+        )
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertNotIn('"entry"', context.captured_queries[0]['sql'])
+
+    def test_bulk_created_articles_have_summary(self):
+        Article.objects.all().delete()
+        token, _ = Token.objects.get_or_create(
+            user=self.user.user_authenticate_data
+        )
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        self.client.post(
+            path=reverse("article-list"),
+            data=[{"title": "Bulk article title", "entry": "bulk " * 60}],
+            format="json"
+        )
+        self.assertEqual(Article.objects.get().word_count, 60)
+
+    def test_backfill_command(self):
+        Article.objects.update(excerpt="", word_count=0, reading_time=0)
+        call_command("backfill_article_summaries", stdout=StringIO())
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.word_count, 450)
+        self.assertEqual(self.article.reading_time, 3)
+
+
+class TestAuthorFeed(APITestCase):
+    def setUp(self):
+        cache.clear()
+        read_counter.flush()
+        self.authors = []
+        for name in ("writer", "other"):
+            data_for_auth = DataForAuthenticateUsers(
+                username=f"{name}1996",
+                email=f"{name}@example.com"
+            )
+            data_for_auth.set_password("Tester1996.,")
+            data_for_auth.save()
+            personal_data = PersonalUsersData.objects.create(
+                first_name="Tester",
+                last_name="Testowy",
+                nick=f"{name}_nick",
+                date_birth=date(1996, 1, 1)
+            )
+            self.authors.append(User.objects.create(
+                user_authenticate_data=data_for_auth,
+                user_personal_data=personal_data
+            ))
+        for number in range(12):
+            Article.objects.create(
+                author=self.authors[number % 2],
+                title=f"Article number {number}",
+                entry=200 * "x",
+                pub_date=date(2020, 1, 1) + timedelta(days=number // 4)
+            )
+        self.expected_titles = list(
+            Article.objects.filter(author=self.authors[0])
+            .order_by("-pub_date", "-id").values_list("title", flat=True)
+        )
+
+    def walk(self, url):
+        titles = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            titles.extend(item['title'] for item in response.json()['results'])
+            url = response.json()['next']
+        return titles
+
+    def test_feed_by_path(self):
+        url = reverse("author-articles", args=["writer_nick"]) + "?page_size=4"
+        self.assertEqual(self.walk(url), self.expected_titles)
+
+    def test_feed_by_query_param(self):
+        url = reverse("article-list") + "?author=writer_nick&page_size=4"
+        self.assertEqual(self.walk(url), self.expected_titles)
+
+    def test_cards_feed(self):
+        url = reverse("article-cards") + "?author=writer_nick&page_size=4"
+        self.assertEqual(self.walk(url), self.expected_titles)
+
+    def test_search_in_feed(self):
+        query = "?q=number&author=writer_nick&page_size=2"
+        url = reverse("article-list") + query
+        titles = self.walk(url)
+        self.assertEqual(len(titles), 6)
+        self.assertEqual(set(titles), set(self.expected_titles))
+        response = self.client.get(
+            reverse("article-list") + "?q=number&author=nobody"
+        )
+        self.assertEqual(response.json()['results'], [])
+        self.assertIsNone(response.json()['next'])
+
+    def test_unknown_nick(self):
+        response = self.client.get(reverse("author-articles", args=["nobody"]))
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get(
+            reverse("article-list"), data={"author": "nobody"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'], [])
+
+    def test_nick_is_resolved_once(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                reverse("author-articles", args=["writer_nick"]),
+                data={"page_size": 2}
+            )
+        self.assertEqual(response.status_code, 200)
+        # Nick to user id, then the page read by author id without a join.
+        self.assertEqual(len(context.captured_queries), 2)
+        queries = [query['sql'] for query in context.captured_queries]
+        self.assertIn('"blog_auth_personalusersdata"', queries[0])
+        self.assertNotIn('"blog_auth_personalusersdata"', queries[1])
+        self.assertIn('"author_id" =', queries[1])
+
+    def test_feed_reads_author_index(self):
+        # Server databases may prefer a sequential scan on a table this small.
+        if connection.vendor != "sqlite":
+            self.skipTest("Plan depends on table statistics.")
+        queryset = (
+            Article.objects.filter(author=self.authors[0])
+            .order_by("-pub_date", "-id")[:10]
+        )
+        self.assertIn("article_author_pub_date_idx", queryset.explain())
@@ -0,0 +1,78 @@
+import asyncio
+
+from django.core.cache import cache
+from django.test import AsyncClient, TransactionTestCase
+
+from rest_framework.reverse import reverse
+
+from blog_entries.models import Article
+from blog_entries.readcounts import read_counter
+from blog_entries.tests.test_vote import create_user
+
+
+# The async views read on pool threads with their own connections, so the
+# rows have to be committed for them to see.
+class TestAsyncArticleViews(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        read_counter.flush()
+        author = create_user("author1996")
+        self.articles = [
+            Article.objects.create(
+                author=author,
+                title=f"Article number {number}",
+                entry=200 * "x"
+            )
+            for number in range(3)
+        ]
+        self.client = AsyncClient()
+
+    def get(self, path):
+        return asyncio.run(self.client.get(path))
+
+    def test_list_matches_sync_list(self):
+        response = self.get(reverse("async-article-list") + "?page_size=2")
+        self.assertEqual(response.status_code, 200)
+        cache.clear()
+        sync_response = self.client_class().get(
+            reverse("article-list"), {"page_size": 2}
+        )
+        self.assertEqual(
+            response.json()["results"], sync_response.json()["results"]
+        )
+        self.assertIn(reverse("async-article-list"), response.json()["next"])
+
+    def test_retrieve(self):
+        article = self.articles[0]
+        response = self.get(reverse("async-article-detail", args=[article.id]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["title"], article.title)
+        self.assertIn("ETag", response)
+
+    def test_retrieve_missing(self):
+        missing_id = self.articles[-1].id + 1
+        response = self.get(
+            reverse("async-article-detail", args=[missing_id])
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_parallel_requests(self):
+        async def read_all():
+            return await asyncio.gather(*[
+                self.client.get(
+                    reverse("async-article-detail", args=[article.id])
+                )
+                for article in self.articles
+            ])
+
+        responses = asyncio.run(read_all())
+        self.assertEqual(
+            [response.json()["title"] for response in responses],
+            [article.title for article in self.articles]
+        )
+
+    def test_write_is_not_allowed(self):
+        response = asyncio.run(
+            self.client.post(reverse("async-article-list"), {})
+        )
+        self.assertIn(response.status_code, (401, 405))
@@ -0,0 +1,110 @@
+import gzip
+import json
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from rest_framework.test import APITestCase
+from rest_framework.reverse import reverse
+
+from blog import middleware
+from blog.middleware import CompressionMiddleware, accepted_encodings
+from blog_entries.models import Article
+from blog_entries.readcounts import read_counter
+from blog_entries.tests.test_vote import create_user
+
+
+class TestCompression(APITestCase):
+    def setUp(self):
+        cache.clear()
+        read_counter.flush()
+        self.article = Article.objects.create(
+            author=create_user("author1996"),
+            title="A long article",
+            entry="lorem ipsum " * 1000
+        )
+        self.detail_path = reverse("article-detail", args=[self.article.id])
+
+    def get(self, path, encoding="gzip", **headers):
+        return self.client.get(path, HTTP_ACCEPT_ENCODING=encoding, **headers)
+
+    def test_accepted_encodings(self):
+        self.assertEqual(
+            accepted_encodings("gzip, deflate, br;q=0"), {"gzip", "deflate"}
+        )
+        self.assertEqual(accepted_encodings("GZIP;q=0.5, *;q=0"), {"gzip"})
+        self.assertEqual(accepted_encodings(""), set())
+
+    @mock.patch.object(middleware, "brotli", None)
+    def test_large_article_is_gzipped(self):
+        response = self.get(self.detail_path, encoding="br, gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(
+            int(response["Content-Length"]), len(response.content)
+        )
+        data = json.loads(gzip.decompress(response.content))
+        self.assertEqual(data["entry"], self.article.entry)
+
+    @skipUnless(middleware.brotli, "brotli is not installed")
+    def test_brotli_is_preferred(self):
+        response = self.get(self.detail_path, encoding="gzip, br")
+        self.assertEqual(response["Content-Encoding"], "br")
+        data = json.loads(middleware.brotli.decompress(response.content))
+        self.assertEqual(data["entry"], self.article.entry)
+
+    def test_not_accepted(self):
+        response = self.get(self.detail_path, encoding="identity")
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response.json()["entry"], self.article.entry)
+
+    @override_settings(COMPRESSION_MIN_SIZE=100000)
+    def test_small_response_is_not_compressed(self):
+        response = self.get(self.detail_path)
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    @override_settings(COMPRESSION_CONTENT_TYPES=["text/html"])
+    def test_content_type_not_allowed(self):
+        response = self.get(self.detail_path)
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_html_is_not_compressed_by_default(self):
+        response = self.get(self.detail_path, HTTP_ACCEPT="text/html")
+        self.assertEqual(response["Content-Type"].split(";")[0], "text/html")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    @override_settings(COMPRESSION_CONTENT_TYPES=["text/html"])
+    def test_response_with_csrf_token_is_not_compressed(self):
+        response = self.client.get(
+            reverse("admin:login"), HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    @mock.patch.object(middleware, "brotli", None)
+    def test_compressed_body_is_cached(self):
+        with mock.patch.object(
+            CompressionMiddleware, "compress", autospec=True,
+            side_effect=CompressionMiddleware.compress
+        ) as compress:
+            first = self.get(self.detail_path)
+            second = self.get(self.detail_path)
+        self.assertEqual(compress.call_count, 1)
+        self.assertEqual(first.content, second.content)
+
+    @mock.patch.object(middleware, "brotli", None)
+    def test_changed_article_is_compressed_again(self):
+        self.get(self.detail_path)
+        self.article.entry = "dolor sit amet " * 1000
+        self.article.save()
+        response = self.get(self.detail_path)
+        data = json.loads(gzip.decompress(response.content))
+        self.assertEqual(data["entry"], self.article.entry)
+
+    @mock.patch.object(middleware, "brotli", None)
+    def test_weak_etag_still_validates(self):
+        etag = self.get(self.detail_path)["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+        response = self.get(self.detail_path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
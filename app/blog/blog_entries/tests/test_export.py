@@ -0,0 +1,82 @@
+import gzip
+import json
+import os
+from tempfile import TemporaryDirectory
+
+from django.core.management import call_command
+
+from rest_framework.test import APITestCase
+from rest_framework.reverse import reverse
+from rest_framework.authtoken.models import Token
+
+from blog_auth.models import DataForAuthenticateUsers, User
+from blog_entries.models import Article
+
+
+class TestArticleExport(APITestCase):
+    def setUp(self):
+        data_for_auth = DataForAuthenticateUsers(
+            username="admin1996",
+            email="admin@example.com",
+            is_staff=True
+        )
+        data_for_auth.set_password("Tester1996.,")
+        data_for_auth.save()
+        self.user = User(user_authenticate_data=data_for_auth)
+        self.user.save()
+        self.token, _ = Token.objects.get_or_create(user=data_for_auth)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        Article.objects.bulk_create(
+            Article(
+                author=self.user,
+                title=f"Exported article {number}",
+                entry=200 * "ż"
+            )
+            for number in range(5)
+        )
+
+    def read_lines(self, content):
+        lines = content.decode('utf-8').splitlines()
+        return [json.loads(line) for line in lines]
+
+    def test_export(self):
+        response = self.client.get(reverse("article-export"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], "application/x-ndjson")
+        rows = self.read_lines(b''.join(response.streaming_content))
+        self.assertEqual(
+            [row['title'] for row in rows],
+            [f"Exported article {number}" for number in range(5)]
+        )
+        self.assertEqual(rows[0]['entry'], 200 * "ż")
+        self.assertEqual(rows[0]['author'], self.user.id)
+
+    def test_export_with_gzip(self):
+        response = self.client.get(
+            reverse("article-export"), HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertEqual(response['Content-Encoding'], "gzip")
+        content = b''.join(response.streaming_content)
+        rows = self.read_lines(gzip.decompress(content))
+        self.assertEqual(len(rows), 5)
+
+    def test_export_ignores_accept(self):
+        response = self.client.get(
+            reverse("article-export"), HTTP_ACCEPT="application/json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], "application/x-ndjson")
+
+    def test_export_for_not_staff_user(self):
+        DataForAuthenticateUsers.objects.update(is_staff=False)
+        response = self.client.get(reverse("article-export"))
+        self.assertEqual(response.status_code, 403)
+
+    def test_export_command(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "articles.ndjson.gz")
+            call_command("export_articles", output=path, gzip=True)
+            with gzip.open(path) as exported:
+                rows = self.read_lines(exported.read())
+        self.assertEqual(len(rows), 5)
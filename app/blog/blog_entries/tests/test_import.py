@@ -0,0 +1,113 @@
+import json
+import os
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import skipUnless
+
+from django.contrib.auth.hashers import check_password, make_password
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from blog_auth.models import DataForAuthenticateUsers, User
+from blog_entries.bulk import bulk_insert_articles, copy_value
+from blog_entries.models import Article
+from blog_entries.search import search_article_ids
+
+
+class TestImportBlogCommand(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.author_auth = DataForAuthenticateUsers.objects.create(
+            username="author1996",
+            email="author@example.com"
+        )
+        self.author = User.objects.create(
+            user_authenticate_data=self.author_auth
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as output:
+            output.write(content)
+        return path
+
+    def run_import(self, *args):
+        out, err = StringIO(), StringIO()
+        call_command("import_blog", *args, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def test_import_users_from_csv(self):
+        hashed = make_password("Tester1996.,")
+        path = self.write(
+            "users.csv",
+            "username,email,password\n"
+            "importer1,importer1@example.com,Secret1996\n"
+            f"importer2,importer2@example.com,{hashed}\n"
+            "author1996,other@example.com,Secret123\n"
+            "x,bad-email,Secret123\n"
+        )
+        out, err = self.run_import("users", path, "--batch-size", "2")
+        self.assertIn("Imported 2 users, skipped 2", out)
+        self.assertIn("rows/s", out)
+        self.assertIn(
+            "Line 4: A user with that username or e-mail already exists.", err
+        )
+        imported = DataForAuthenticateUsers.objects.get(username="importer1")
+        self.assertTrue(check_password("Secret1996", imported.password))
+        self.assertEqual(
+            DataForAuthenticateUsers.objects.get(
+                username="importer2"
+            ).password,
+            hashed
+        )
+        self.assertTrue(
+            User.objects.filter(user_authenticate_data=imported).exists()
+        )
+
+    def test_import_articles_from_jsonl(self):
+        entry = 200 * "x"
+        rows = [
+            {"author": "author1996", "title": "Imported by username",
+             "entry": entry},
+            {"author": "author@example.com", "title": "Imported by email",
+             "entry": entry, "pub_date": "2020-02-02"},
+            {"author": "author1996", "title": "short", "entry": entry},
+            {"author": "nobody", "title": "Imported for nobody",
+             "entry": entry},
+        ]
+        lines = [json.dumps(row) for row in rows] + ["not json", ""]
+        path = self.write("articles.jsonl", "\n".join(lines))
+        with self.assertNumQueries(6):
+            out, err = self.run_import("articles", path)
+        self.assertIn("Imported 2 articles, skipped 3", out)
+        self.assertIn(
+            "Line 3: title: Ensure this field has at least 10 characters.", err
+        )
+        self.assertIn("Line 4: Unknown author: nobody.", err)
+        self.assertIn("Line 5: Invalid row", err)
+        self.assertEqual(Article.objects.filter(author=self.author).count(), 2)
+        article = Article.objects.get(title="Imported by email")
+        self.assertEqual(str(article.pub_date), "2020-02-02")
+        self.assertEqual(len(search_article_ids("imported", limit=10)), 2)
+
+
+class TestCopyArticles(TestCase):
+    def test_copy_value(self):
+        self.assertEqual(copy_value(None), "\\N")
+        self.assertEqual(copy_value(""), "")
+        self.assertEqual(copy_value(7), "7")
+        self.assertEqual(copy_value("a\tb\nc\\N"), "a\\tb\\nc\\\\N")
+
+    @skipUnless(connection.vendor == "postgresql", "COPY needs PostgreSQL")
+    def test_copy_keeps_nulls_and_special_characters(self):
+        title = "Tab\tnewline\nand \\N"
+        bulk_insert_articles(
+            [Article(title=title, entry=200 * "x")], use_copy=True
+        )
+        article = Article.objects.get()
+        self.assertIsNone(article.author_id)
+        self.assertEqual(article.title, title)
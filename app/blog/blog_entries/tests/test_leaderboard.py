@@ -0,0 +1,102 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils.timezone import now
+
+from rest_framework.test import APITestCase
+from rest_framework.reverse import reverse
+
+from blog_entries.models import Article, Vote
+from blog_entries.tests.test_vote import create_user
+
+
+class TestLeaderboard(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = create_user("author1996")
+        self.voters = [create_user(f"voter{number}") for number in range(3)]
+        today = now().date()
+        self.old = self.create_article(
+            "Old but popular", today - timedelta(days=100)
+        )
+        self.recent = self.create_article("Recent and liked", today)
+        self.disliked = self.create_article("Recent and disliked", today)
+        for voter in self.voters:
+            Vote.objects.cast(voter, self.old, Vote.LIKE)
+        Vote.objects.cast(self.voters[0], self.recent, Vote.LIKE)
+        Vote.objects.cast(self.voters[0], self.disliked, Vote.DISLIKE)
+
+    def create_article(self, title, pub_date):
+        return Article.objects.create(
+            author=self.author,
+            title=title,
+            entry=200 * "x",
+            pub_date=pub_date
+        )
+
+    def board(self, **params):
+        response = self.client.get(reverse("article-leaderboard"), data=params)
+        self.assertEqual(response.status_code, 200)
+        return [(item["title"], item["score"]) for item in response.json()]
+
+    def test_score_follows_votes(self):
+        Vote.objects.cast(self.voters[0], self.recent, Vote.DISLIKE)
+        self.recent.refresh_from_db()
+        self.assertEqual(
+            (self.recent.like, self.recent.dislike, self.recent.score),
+            (0, 1, -1)
+        )
+
+    def test_all_time(self):
+        self.assertEqual(
+            self.board(),
+            [
+                ("Old but popular", 3),
+                ("Recent and liked", 1),
+                ("Recent and disliked", -1),
+            ]
+        )
+
+    def test_period_and_limit(self):
+        self.assertEqual(
+            self.board(period="week", page_size=1), [("Recent and liked", 1)]
+        )
+
+    def test_unknown_period(self):
+        response = self.client.get(
+            reverse("article-leaderboard"), data={"period": "decade"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_board_is_cached(self):
+        self.board()
+        with self.assertNumQueries(0):
+            self.board()
+
+    def test_read_only(self):
+        response = self.client.post(reverse("article-leaderboard"))
+        self.assertEqual(response.status_code, 401)
+
+    def test_refresh_command(self):
+        Article.objects.update(score=0)
+        Article.objects.filter(pk=self.old.pk).update(like=7)
+        call_command("refresh_leaderboard", stdout=StringIO())
+        self.assertEqual(self.board()[0], ("Old but popular", 7))
+        call_command("refresh_leaderboard", "--from-votes", stdout=StringIO())
+        self.assertEqual(self.board()[0], ("Old but popular", 3))
+
+    def test_refresh_from_votes_keeps_counters_without_votes(self):
+        legacy = self.create_article("Legacy counters", now().date())
+        Article.objects.filter(pk=legacy.pk).update(like=5, dislike=1)
+        Article.objects.filter(pk=self.old.pk).update(like=9)
+        out = StringIO()
+        call_command("refresh_leaderboard", "--from-votes", stdout=out)
+        self.assertIn("Recounted votes of 3 articles", out.getvalue())
+        legacy.refresh_from_db()
+        self.old.refresh_from_db()
+        self.assertEqual(
+            (legacy.like, legacy.dislike, legacy.score), (5, 1, 4)
+        )
+        self.assertEqual((self.old.like, self.old.score), (3, 3))
@@ -0,0 +1,91 @@
+from django.core.cache import cache
+from django.db import OperationalError, connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APITestCase
+from rest_framework.reverse import reverse
+
+from blog_entries.models import Article
+from blog_entries.readcounts import ReadCounter, read_counter
+from blog_entries.tests.test_vote import create_user
+
+
+@override_settings(
+    ARTICLE_VIEWS_FLUSH_INTERVAL=3600, ARTICLE_VIEWS_FLUSH_SIZE=5
+)
+class TestReadCount(APITestCase):
+    def setUp(self):
+        cache.clear()
+        read_counter.flush()
+        author = create_user("author1996")
+        self.articles = [
+            Article.objects.create(
+                author=author,
+                title=f"Article number {number}",
+                entry=200 * "x"
+            )
+            for number in range(2)
+        ]
+
+    def read(self, article, **headers):
+        return self.client.get(
+            reverse("article-detail", args=[article.id]), **headers
+        )
+
+    def views(self):
+        return [article.views for article in Article.objects.order_by("id")]
+
+    def test_reads_are_buffered(self):
+        self.read(self.articles[0])
+        self.read(self.articles[0])
+        self.assertEqual(self.views(), [0, 0])
+        self.assertEqual(read_counter.flush(), 2)
+        self.assertEqual(self.views(), [2, 0])
+
+    def test_cached_and_not_modified_reads_count(self):
+        etag = self.read(self.articles[0])["ETag"]
+        self.read(self.articles[0])
+        response = self.read(self.articles[0], HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        read_counter.flush()
+        self.assertEqual(self.views(), [3, 0])
+
+    def test_missing_article_is_not_counted(self):
+        missing_id = self.articles[1].id + 1
+        response = self.client.get(
+            reverse("article-detail", args=[missing_id])
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(read_counter.flush(), 0)
+
+    def test_flush_size_triggers_one_update(self):
+        for article in 2 * self.articles:
+            self.read(article)
+        with CaptureQueriesContext(connection) as context:
+            self.read(self.articles[0])
+        updates = [
+            query["sql"] for query in context.captured_queries
+            if query["sql"].startswith("UPDATE")
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(self.views(), [3, 2])
+
+    def test_reads_do_not_invalidate_cache(self):
+        self.read(self.articles[0])
+        read_counter.flush()
+        with self.assertNumQueries(0):
+            self.read(self.articles[0])
+
+    def test_failed_flush_keeps_reads(self):
+        counter = ReadCounter()
+        counter.add(self.articles[0].id)
+        with connection.execute_wrapper(self.fail):
+            with self.assertRaises(OperationalError):
+                counter.flush()
+        self.assertEqual(counter.flush(), 1)
+        self.assertEqual(self.views(), [1, 0])
+
+    @staticmethod
+    def fail(execute, sql, params, many, context):
+        raise OperationalError("Database is gone")
@@ -0,0 +1,76 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock, skipUnless
+from uuid import UUID
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from blog import renderers
+from blog.renderers import FastJSONParser, FastJSONRenderer
+
+DATA = {
+    "title": "Zażółć gęślą jaźń",
+    "created": datetime(2020, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+    "pub_date": date(2020, 1, 2),
+    "price": Decimal("1.50"),
+    "message": gettext_lazy("This field is required."),
+    "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+    "nested": [{"like": 1, "dislike": None, "active": True}],
+    1: "integer key",
+}
+
+
+@skipUnless(renderers.orjson, "orjson is not installed")
+class TestFastJSONRenderer(SimpleTestCase):
+    def test_same_output_as_json_renderer(self):
+        self.assertEqual(
+            FastJSONRenderer().render(DATA), JSONRenderer().render(DATA)
+        )
+
+    def test_indent_falls_back(self):
+        media_type = "application/json; indent=4"
+        self.assertEqual(
+            FastJSONRenderer().render(DATA, media_type),
+            JSONRenderer().render(DATA, media_type)
+        )
+
+    def test_without_orjson(self):
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertEqual(
+                FastJSONRenderer().render(DATA), JSONRenderer().render(DATA)
+            )
+
+    def test_none(self):
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+
+@skipUnless(renderers.orjson, "orjson is not installed")
+class TestFastJSONParser(SimpleTestCase):
+    body = (
+        '{"title": "Zażółć gęślą jaźń", "numbers": [1, 2.5, null]}'
+    ).encode("utf-8")
+
+    def test_same_result_as_json_parser(self):
+        self.assertEqual(
+            FastJSONParser().parse(BytesIO(self.body)),
+            JSONParser().parse(BytesIO(self.body))
+        )
+
+    def test_invalid_json(self):
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(BytesIO(b'{"title": '))
+
+    def test_other_encoding_falls_back(self):
+        body = '{"title": "Zażółć"}'.encode("utf-16")
+        self.assertEqual(
+            FastJSONParser().parse(
+                BytesIO(body), parser_context={"encoding": "utf-16"}
+            ),
+            {"title": "Zażółć"}
+        )
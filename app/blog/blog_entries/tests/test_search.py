@@ -0,0 +1,82 @@
+from django.core.cache import cache
+
+from rest_framework.test import APITestCase
+from rest_framework.reverse import reverse
+
+from blog_auth.models import DataForAuthenticateUsers, User
+from blog_entries.models import Article
+
+
+class TestArticleSearch(APITestCase):
+    def setUp(self):
+        cache.clear()
+        data_for_auth = DataForAuthenticateUsers(
+            username="tester1996",
+            email="tester@example.com"
+        )
+        data_for_auth.set_password("Tester1996.,")
+        data_for_auth.save()
+        self.user = User(user_authenticate_data=data_for_auth)
+        self.user.save()
+        self.python = Article.objects.create(
+            author=self.user,
+            title="Writing fast python code",
+            entry="python " * 10 + 200 * "x"
+        )
+        self.django = Article.objects.create(
+            author=self.user,
+            title="Django and python together",
+            entry="django " + 200 * "y"
+        )
+        self.gardening = Article.objects.create(
+            author=self.user,
+            title="Gardening for beginners",
+            entry="tomatoes " + 200 * "z"
+        )
+
+    def search(self, **params):
+        response = self.client.get(path=reverse("article-list"), data=params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_search_ranks_matches(self):
+        data = self.search(q="python")
+        self.assertEqual(
+            [item['title'] for item in data['results']],
+            [self.python.title, self.django.title]
+        )
+
+    def test_search_matches_all_words(self):
+        data = self.search(q="django python")
+        self.assertEqual(
+            [item['title'] for item in data['results']], [self.django.title]
+        )
+
+    def test_search_without_matches(self):
+        self.assertEqual(self.search(q="astronomy")['results'], [])
+
+    def test_search_with_fts_syntax_characters(self):
+        self.assertEqual(self.search(q='python" OR (*')['results'], [])
+
+    def test_search_is_paginated(self):
+        first = self.search(q="python", page_size=1)
+        self.assertEqual(len(first['results']), 1)
+        self.assertIsNone(first['previous'])
+        second = self.client.get(first['next']).json()
+        self.assertEqual(len(second['results']), 1)
+        self.assertIsNone(second['next'])
+        self.assertIsNotNone(second['previous'])
+        self.assertNotEqual(first['results'], second['results'])
+
+    def test_search_with_invalid_page(self):
+        response = self.client.get(
+            path=reverse("article-list"), data={"q": "python", "page": 0}
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_search_index_follows_updates(self):
+        self.gardening.title = "Gardening with python scripts"
+        self.gardening.save()
+        self.assertEqual(len(self.search(q="python")['results']), 3)
+        self.python.delete()
+        self.assertEqual(len(self.search(q="python")['results']), 2)
@@ -0,0 +1,146 @@
+from threading import Barrier, Thread
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import IntegrityError, connection
+from django.test import TransactionTestCase, skipUnlessDBFeature
+
+from rest_framework.test import APITestCase
+from rest_framework.reverse import reverse
+from rest_framework.authtoken.models import Token
+
+from blog_auth.models import DataForAuthenticateUsers, User
+from blog_entries.models import Article, Vote
+
+
+def create_user(username):
+    data_for_auth = DataForAuthenticateUsers(
+        username=username,
+        email=f"{username}@example.com"
+    )
+    data_for_auth.set_password("Tester1996.,")
+    data_for_auth.save()
+    user = User(user_authenticate_data=data_for_auth)
+    user.save()
+    return user
+
+
+class TestVoteView(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = create_user("tester1996")
+        self.token, _ = Token.objects.get_or_create(
+            user=self.user.user_authenticate_data
+        )
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.article = Article.objects.create(
+            author=create_user("author1996"),
+            title="Article to vote on",
+            entry=200 * "x"
+        )
+
+    def vote(self, name):
+        return self.client.post(
+            path=reverse(f"article-{name}", args=[self.article.id])
+        )
+
+    def test_like(self):
+        response = self.vote("like")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"like": 1, "dislike": 0})
+        self.assertEqual(Vote.objects.get().value, Vote.LIKE)
+
+    def test_like_twice_counts_once(self):
+        self.vote("like")
+        response = self.vote("like")
+        self.assertEqual(response.json(), {"like": 1, "dislike": 0})
+        self.assertEqual(Vote.objects.count(), 1)
+
+    def test_change_like_to_dislike(self):
+        self.vote("like")
+        response = self.vote("dislike")
+        self.assertEqual(response.json(), {"like": 0, "dislike": 1})
+        self.assertEqual(Vote.objects.get().value, Vote.DISLIKE)
+
+    def test_vote_on_foreign_article_is_allowed(self):
+        response = self.vote("dislike")
+        self.assertEqual(response.status_code, 200)
+
+    def test_vote_without_authentication(self):
+        self.client.credentials()
+        response = self.vote("like")
+        self.assertEqual(response.status_code, 401)
+        self.assertFalse(Vote.objects.exists())
+
+    def test_vote_on_missing_article(self):
+        response = self.client.post(
+            path=reverse("article-like", args=[self.article.id + 1])
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_counters_above_small_integer_range(self):
+        Article.objects.filter(pk=self.article.pk).update(like=40000)
+        response = self.vote("like")
+        self.assertEqual(response.json()["like"], 40001)
+
+    def test_conflicting_vote_deleted_before_retry(self):
+        create = Vote.objects.create
+        calls = []
+
+        def create_once_conflicting(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                raise IntegrityError("duplicate vote")
+            return create(**kwargs)
+
+        with mock.patch.object(
+            Vote.objects, "create", create_once_conflicting
+        ):
+            like, dislike = Vote.objects.cast(
+                self.user, self.article, Vote.LIKE
+            )
+        self.assertEqual((like, dislike), (1, 0))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(Vote.objects.get().value, Vote.LIKE)
+
+
+# SQLite in-memory test databases lock whole tables, so parallel writers
+# can only be exercised on a server database such as PostgreSQL.
+@skipUnlessDBFeature('has_select_for_update')
+class TestConcurrentVotes(TransactionTestCase):
+    number_voters = 8
+
+    def setUp(self):
+        self.article = Article.objects.create(
+            author=create_user("author1996"),
+            title="Article to vote on",
+            entry=200 * "x"
+        )
+        self.voters = [
+            create_user(f"voter{number}")
+            for number in range(self.number_voters)
+        ]
+
+    def test_parallel_votes_are_not_lost(self):
+        barrier = Barrier(self.number_voters)
+        errors = []
+
+        def vote(user):
+            try:
+                barrier.wait()
+                Vote.objects.cast(self.user, self.article, Vote.LIKE)
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(error)
+            finally:
+                connection.close()
+
+        threads = [Thread(target=vote, args=(user,)) for user in self.voters]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.like, self.number_voters)
+        self.assertEqual(Vote.objects.count(), self.number_voters)
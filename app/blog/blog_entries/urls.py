@@ -2,11 +2,27 @@ from django.urls import include, path
 
 from rest_framework.routers import DefaultRouter
 
+from . import async_views
 from .views import ArticleViewSet
 
 router = DefaultRouter()
 router.register(r'article', ArticleViewSet)
 
 urlpatterns = [
+    path(
+        'author/<str:nick>/articles/',
+        ArticleViewSet.as_view({'get': 'list'}),
+        name='author-articles'
+    ),
+    path(
+        'async/article/',
+        async_views.article_list,
+        name='async-article-list'
+    ),
+    path(
+        'async/article/<int:pk>/',
+        async_views.article_detail,
+        name='async-article-detail'
+    ),
     path('', include(router.urls)),
 ]
@@ -1,27 +1,293 @@
-from rest_framework import status
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.permissions import (
+    IsAdminUser, IsAuthenticated, IsAuthenticatedOrReadOnly
+)
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
 from blog_auth.models import User
-from .models import Article 
+from .cache import (
+    detail_cache_key, get_cache, get_leaderboard_timeout, get_timeout,
+    get_updated_at, leaderboard_cache_key, list_cache_key, list_etag, make_etag
+)
+from .export import (
+    IgnoreAcceptNegotiation, NDJSONRenderer, iter_gzip, iter_ndjson
+)
+from .leaderboard import PERIODS, top_articles
+from .models import Article, Vote
+from .pagination import ArticlePagination, SearchPagination
+from .readcounts import count_read
 from .permissions import IsOwnerOrSuperUserOrReadOnly
-from .serializers import ArticleSerializer
+from .serializers import (
+    ArticleCardSerializer, ArticleScoreSerializer, ArticleSerializer
+)
 
 class ArticleViewSet(ModelViewSet):
     serializer_class = ArticleSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrSuperUserOrReadOnly]
-    queryset = Article.objects.all()
+    pagination_class = ArticlePagination
+    queryset = Article.objects.select_related('author')
+    bulk_create_limit = 500
+    fields_query_param = 'fields'
+    always_loaded_fields = ['id', 'pub_date']
+    author_query_param = 'author'
+    period_query_param = 'period'
+
+    @property
+    def paginator(self):
+        """
+        Ranked search results given by ``?q=`` are paged by number, the plain
+        list by keyset.
+        """
+        if not hasattr(self, '_paginator'):
+            query_params = self.request.query_params
+            searched = SearchPagination.search_query_param in query_params
+            if self.action in ('list', 'cards') and searched:
+                self._paginator = SearchPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    def get_sparse_fields(self):
+        """
+        Return the field names given by ``?fields=`` on reads, or None when
+        the whole representation is wanted.
+        """
+        if self.action not in ('list', 'retrieve', 'cards'):
+            return None
+        value = self.request.query_params.get(self.fields_query_param)
+        if value is None:
+            return None
+        fields = [name.strip() for name in value.split(',') if name.strip()]
+        unknown = set(fields) - set(self.get_serializer_class().Meta.fields)
+        if unknown:
+            message = f"Unknown fields: {', '.join(sorted(unknown))}."
+            raise ValidationError(detail={self.fields_query_param: message})
+        return fields
+
+    def get_author_nick(self):
+        """
+        Return the nick of the author whose feed is read, given by the
+        ``nick`` URL kwarg or by ``?author=``, or None for every author.
+        """
+        if self.action not in ('list', 'cards'):
+            return None
+        return self.kwargs.get(
+            'nick', self.request.query_params.get(self.author_query_param)
+        )
+
+    def get_author_id(self, nick):
+        """
+        Resolve nick to a blog user id with a single lookup, so articles are
+        then read by author id alone. An unknown nick in the URL is a 404.
+        """
+        queryset = User.objects.filter(
+            user_personal_data__nick=nick
+        ).values_list('id', flat=True)
+        author_id = next(iter(queryset[:1]), None)
+        if author_id is None and 'nick' in self.kwargs:
+            raise NotFound('Author not found.')
+        return author_id
+
+    def get_queryset(self):
+        """
+        With sparse fields, only the requested columns and the ordering
+        columns are read, so e.g. ``?fields=title`` never loads entry.
+        An author feed pages over the (author, pub_date, id) index.
+        """
+        queryset = super().get_queryset()
+        nick = self.get_author_nick()
+        self.author_id = None
+        if nick is not None:
+            self.author_id = self.get_author_id(nick)
+            if self.author_id is None:
+                queryset = queryset.none()
+            else:
+                queryset = queryset.filter(author_id=self.author_id)
+        fields = self.get_sparse_fields()
+        if fields is None and self.action == 'cards':
+            fields = ArticleCardSerializer.Meta.fields
+        if fields is not None:
+            queryset = queryset.select_related(None).only(
+                *self.always_loaded_fields, *fields
+            )
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'cards':
+            return ArticleCardSerializer
+        return self.serializer_class
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_sparse_fields()
+        if fields is not None:
+            kwargs['fields'] = fields
+        return super().get_serializer(*args, **kwargs)
 
     def create(self, request, *args, **kwargs):
+        if isinstance(request.data, list):
+            return self.bulk_create(request)
         serializer = self.serializer_class(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = User.objects.get(user_authenticate_data=request.user)
-        instance_article = serializer.save()
-        instance_article.author = user
-        instance_article.save()
+        with transaction.atomic():
+            serializer.save(
+                author=User.objects.get_for_auth_data(request.user)
+            )
         return Response(
             data=serializer.data,
             status=status.HTTP_201_CREATED
-        )
\ No newline at end of file
+        )
+
+    def bulk_create(self, request):
+        """
+        Create every article of a JSON array at once. Nothing is written
+        unless all items are valid, errors are reported per item.
+        """
+        if len(request.data) > self.bulk_create_limit:
+            raise ValidationError(
+                detail=f"Ensure this list has no more than "
+                       f"{self.bulk_create_limit} articles."
+            )
+        serializer = self.serializer_class(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save(author=User.objects.get_for_auth_data(request.user))
+        return Response(
+            data=serializer.data,
+            status=status.HTTP_201_CREATED
+        )
+
+    def list(self, request, *args, **kwargs):
+        etag = list_etag(request)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+        response = self.cached_response(
+            list_cache_key(request),
+            super().list, request, *args, **kwargs
+        )
+        response['ETag'] = etag
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        pk = kwargs[self.lookup_field]
+        updated_at = get_updated_at(pk)
+        if updated_at is None:
+            # Missing articles are not cached, so they create no cache keys.
+            return super().retrieve(request, *args, **kwargs)
+        # Keys are made from the number, so '007' shares the cache of 7.
+        pk = int(pk)
+        # Counted before any cache or conditional answer, so every read counts.
+        count_read(pk)
+        etag = make_etag(request, pk, updated_at.timestamp())
+        last_modified = int(updated_at.timestamp())
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if not_modified is not None:
+            return not_modified
+        response = self.cached_response(
+            detail_cache_key(request, pk),
+            super().retrieve, request, *args, **kwargs
+        )
+        if response.status_code == status.HTTP_200_OK:
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    @action(methods=['GET'], detail=False)
+    def cards(self, request, *args, **kwargs):
+        """
+        Lightweight list for article cards: excerpt, word count and reading
+        time are precomputed, so entry is never read.
+        """
+        return self.list(request, *args, **kwargs)
+
+    @action(methods=['GET'], detail=False)
+    def leaderboard(self, request, *args, **kwargs):
+        """
+        Best scored articles of all time, or of the last day, week, month
+        or year given by ``?period=``. Boards are cached for a short while.
+        """
+        period = request.query_params.get(self.period_query_param, 'all')
+        if period not in PERIODS:
+            message = f"Choose one of: {', '.join(PERIODS)}."
+            raise ValidationError(detail={self.period_query_param: message})
+        limit = self.paginator.get_page_size(request)
+        key = leaderboard_cache_key(period, limit)
+        cache = get_cache()
+        data = cache.get(key)
+        if data is None:
+            data = ArticleScoreSerializer(
+                top_articles(period, limit), many=True
+            ).data
+            cache.set(key, data, get_leaderboard_timeout())
+        response = Response(data)
+        response.cache_compressed = True
+        return response
+
+    @action(
+        methods=['GET'], detail=False,
+        permission_classes=[IsAdminUser], renderer_classes=[NDJSONRenderer],
+        content_negotiation_class=IgnoreAcceptNegotiation
+    )
+    def export(self, request, *args, **kwargs):
+        """
+        Stream every article as NDJSON, gzip compressed when the client
+        accepts it. Memory use does not depend on the number of articles.
+        """
+        chunks = iter_ndjson()
+        accepts_gzip = 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', '')
+        if accepts_gzip:
+            chunks = iter_gzip(chunks)
+        response = StreamingHttpResponse(
+            chunks, content_type=NDJSONRenderer.media_type
+        )
+        response['Content-Disposition'] = (
+            'attachment; filename="articles.ndjson"'
+        )
+        response['Vary'] = 'Accept-Encoding'
+        if accepts_gzip:
+            response['Content-Encoding'] = 'gzip'
+        return response
+
+    @action(
+        methods=['POST'], detail=True, permission_classes=[IsAuthenticated]
+    )
+    def like(self, request, *args, **kwargs):
+        return self.vote(request, Vote.LIKE)
+
+    @action(
+        methods=['POST'], detail=True, permission_classes=[IsAuthenticated]
+    )
+    def dislike(self, request, *args, **kwargs):
+        return self.vote(request, Vote.DISLIKE)
+
+    def vote(self, request, value):
+        article = self.get_object()
+        user = User.objects.get_for_auth_data(request.user)
+        like, dislike = Vote.objects.cast(user, article, value)
+        return Response(data=dict(like=like, dislike=dislike))
+
+    def cached_response(self, key, view, request, *args, **kwargs):
+        """
+        Serve the response data stored under key, or build it with view and
+        store it. Only successful responses are cached, and so are their
+        compressed representations.
+        """
+        cache = get_cache()
+        data = cache.get(key)
+        if data is not None:
+            response = Response(data)
+        else:
+            response = view(request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                cache.set(key, response.data, get_timeout())
+        response.cache_compressed = True
+        return response